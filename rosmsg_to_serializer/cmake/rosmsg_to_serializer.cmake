@@ -4,11 +4,75 @@
 # Find Python3 for running the generator
 find_package(Python3 REQUIRED COMPONENTS Interpreter)
 
+# Paths in the generator's depfile are absolute; let CMake pass them through as-is
+if(POLICY CMP0116)
+    cmake_policy(SET CMP0116 NEW)
+endif()
+
 # Main function to execute message serializer generation
+# Usage: custom_execute_command(<message types>... [IOVEC] [ACCESSORS] [SHM_RING] [PYTHON_BINDINGS] [CRC crc32|crc16]
+#                                [MESSAGES <message types>...] [PACKAGES <packages>...] [TABLE_DRIVEN <message types>...])
+#   Message types must come first or after MESSAGES: anything following PACKAGES or
+#   TABLE_DRIVEN belongs to that list. <type> below is the lowercased C type name
+#   of a message, e.g. sensor_msgs__msg__image for sensor_msgs/msg/Image. Each
+#   function is also available under the lowercased message name (image) unless
+#   another generated message shares that name.
+#   IOVEC: also generate scatter-gather serializers (serialize_<type>_iovec)
+#   ACCESSORS: also generate access.h with get_<type>_<field> accessors that read
+#              single fields in place and get_<type>_wire_length
+#   SHM_RING: also generate common/shm_ring.h (shared-memory SPSC ring) and
+#             write_/read_<type>_shm_ring helpers that (de)serialize in place
+#   PYTHON_BINDINGS: also generate generated/python/msg_codecs.py (ctypes bindings)
+#                    and build its shared library as target msg_serializer_python_bindings;
+#                    add the message include directories to that target
+#   CRC: also generate serialize_/deserialize_<type>_big_endian_crc, which append
+#        and verify a checksum trailer computed while (de)serializing
+#   MESSAGES: message types to generate, same as the leading ones
+#   PACKAGES: generate every message of these packages
+#   TABLE_DRIVEN: generate these messages as compact descriptor tables run by a
+#                 shared interpreter (smaller code, same API and wire format); the
+#                 interpreter is built once as target msg_serializer_table_codec and
+#                 linked by add_msg_serializer_dependency()
+# Each message also gets <package>/<Name>/codec.h, which includes only that
+# message's own headers; include it instead of dynamic_serializer_integration.h
+# so a target compiles and rebuilds only for the types it uses.
+# Generation runs in-process. Set ROSMSG_TO_SERIALIZER_USE_SERVER=1 to delegate it
+# to a warm generator server (python3 -m rosmsg_to_serializer --serve) started
+# from the same environment; without one it still runs in-process.
 function(custom_execute_command)
-    set(messages ${ARGV})
+    cmake_parse_arguments(ARG "IOVEC;ACCESSORS;SHM_RING;PYTHON_BINDINGS" "CRC" "MESSAGES;PACKAGES;TABLE_DRIVEN" ${ARGV})
+    set(messages ${ARG_UNPARSED_ARGUMENTS} ${ARG_MESSAGES})
+    
+    set(generator_options)
+    if(ARG_IOVEC)
+        list(APPEND generator_options --iovec)
+    endif()
+    
+    if(ARG_ACCESSORS)
+        list(APPEND generator_options --accessors)
+    endif()
+    
+    if(ARG_SHM_RING)
+        list(APPEND generator_options --shm-ring)
+    endif()
     
-    if(NOT messages)
+    if(ARG_PYTHON_BINDINGS)
+        list(APPEND generator_options --python-bindings)
+    endif()
+    
+    if(ARG_CRC)
+        list(APPEND generator_options --crc ${ARG_CRC})
+    endif()
+    
+    if(ARG_PACKAGES)
+        list(APPEND generator_options --packages ${ARG_PACKAGES})
+    endif()
+    
+    if(ARG_TABLE_DRIVEN)
+        list(APPEND generator_options --table-driven ${ARG_TABLE_DRIVEN})
+    endif()
+    
+    if(NOT messages AND NOT ARG_PACKAGES AND NOT ARG_TABLE_DRIVEN)
         message(FATAL_ERROR "custom_execute_command: No messages specified")
     endif()
     
@@ -19,15 +83,78 @@ function(custom_execute_command)
     # Set PYTHONPATH to include the rosmsg_to_serializer package source directory
     set(rosmsg_to_serializer_PYTHON_PATH "${CMAKE_CURRENT_LIST_DIR}/..")
     
-    # Create custom target for serializer generation
-    add_custom_target(generate_msg_serializers
+    set(generator_stamp "${SERIALIZER_OUTPUT_DIR}/rosmsg_to_serializer.stamp")
+    set(generator_depfile "${SERIALIZER_OUTPUT_DIR}/rosmsg_to_serializer.d")
+    file(GLOB generator_sources
+        "${rosmsg_to_serializer_PYTHON_PATH}/rosmsg_to_serializer/*.py"
+        "${rosmsg_to_serializer_PYTHON_PATH}/rosmsg_to_serializer/module/*.py"
+    )
+    
+    # The generator writes a depfile mapping the stamp to every message definition it read,
+    # so it reruns only when a definition, the generator or its command line changes.
+    # Makefile generators support DEPFILE from CMake 3.20; older ones rerun on generator changes only.
+    set(generator_depfile_args)
+    if(CMAKE_GENERATOR MATCHES "Ninja" OR CMAKE_VERSION VERSION_GREATER_EQUAL 3.20)
+        set(generator_depfile_args DEPFILE "${generator_depfile}")
+    endif()
+    
+    set(generator_byproducts)
+    if(ARG_TABLE_DRIVEN)
+        list(APPEND generator_byproducts "${SERIALIZER_OUTPUT_DIR}/common/table_codec.c")
+    endif()
+    if(ARG_PYTHON_BINDINGS)
+        list(APPEND generator_byproducts
+            "${SERIALIZER_OUTPUT_DIR}/python/msg_codecs.c"
+            "${SERIALIZER_OUTPUT_DIR}/python/msg_codecs.py"
+        )
+    endif()
+    
+    # Headers whose content did not change keep their timestamps, so only targets
+    # including the changed types' headers recompile
+    add_custom_command(
+        OUTPUT "${generator_stamp}"
+        BYPRODUCTS ${generator_byproducts}
         COMMAND ${CMAKE_COMMAND} -E env "PYTHONPATH=${rosmsg_to_serializer_PYTHON_PATH}:$ENV{PYTHONPATH}" 
                 ${Python3_EXECUTABLE} -m rosmsg_to_serializer.rosmsg_to_serializer
                 --output-dir "${SERIALIZER_OUTPUT_DIR}"
+                --depfile "${generator_depfile}"
+                --stamp "${generator_stamp}"
+                ${generator_options}
                 --messages ${messages}
-        COMMENT "Generating serializers for messages: ${messages}"
+        DEPENDS ${generator_sources}
+        ${generator_depfile_args}
+        COMMENT "Generating serializers for messages: ${messages} ${ARG_PACKAGES}"
         VERBATIM
     )
+    add_custom_target(generate_msg_serializers DEPENDS "${generator_stamp}")
+    
+    set(table_codec_target)
+    if(ARG_TABLE_DRIVEN)
+        # The table interpreter is compiled once here rather than in every user of its header
+        set(table_codec_source "${SERIALIZER_OUTPUT_DIR}/common/table_codec.c")
+        set_source_files_properties("${table_codec_source}" PROPERTIES GENERATED TRUE)
+        add_library(msg_serializer_table_codec STATIC "${table_codec_source}")
+        target_include_directories(msg_serializer_table_codec PUBLIC "${SERIALIZER_OUTPUT_DIR}")
+        set_target_properties(msg_serializer_table_codec PROPERTIES POSITION_INDEPENDENT_CODE ON)
+        add_dependencies(msg_serializer_table_codec generate_msg_serializers)
+        set(table_codec_target msg_serializer_table_codec)
+    endif()
+    
+    if(ARG_PYTHON_BINDINGS)
+        # Shared library loaded by generated/python/msg_codecs.py, built next to it
+        set(python_bindings_source "${SERIALIZER_OUTPUT_DIR}/python/msg_codecs.c")
+        set_source_files_properties("${python_bindings_source}" PROPERTIES GENERATED TRUE)
+        add_library(msg_serializer_python_bindings SHARED "${python_bindings_source}")
+        set_target_properties(msg_serializer_python_bindings PROPERTIES
+            OUTPUT_NAME msg_serializer_codecs
+            LIBRARY_OUTPUT_DIRECTORY "${SERIALIZER_OUTPUT_DIR}/python"
+            RUNTIME_OUTPUT_DIRECTORY "${SERIALIZER_OUTPUT_DIR}/python"
+        )
+        add_dependencies(msg_serializer_python_bindings generate_msg_serializers)
+        if(table_codec_target)
+            target_link_libraries(msg_serializer_python_bindings PRIVATE ${table_codec_target})
+        endif()
+    endif()
     
     # Add include directory for generated headers
     include_directories("${SERIALIZER_OUTPUT_DIR}")
@@ -35,8 +162,10 @@ function(custom_execute_command)
     # Make this target available globally
     set_property(GLOBAL PROPERTY MSG_SERIALIZER_TARGET generate_msg_serializers)
     set_property(GLOBAL PROPERTY MSG_SERIALIZER_OUTPUT_DIR "${SERIALIZER_OUTPUT_DIR}")
+    set_property(GLOBAL PROPERTY MSG_SERIALIZER_DEPFILE "${generator_depfile}")
+    set_property(GLOBAL PROPERTY MSG_SERIALIZER_LIBRARIES ${table_codec_target})
     
-    message(STATUS "rosmsg_to_serializer: Configured for messages: ${messages}")
+    message(STATUS "rosmsg_to_serializer: Configured for messages: ${messages} ${ARG_PACKAGES}")
     message(STATUS "rosmsg_to_serializer: Output directory: ${SERIALIZER_OUTPUT_DIR}")
 endfunction()
 
@@ -46,6 +175,10 @@ function(add_msg_serializer_dependency target_name)
     if(serializer_target)
         add_dependencies(${target_name} ${serializer_target})
     endif()
+    get_property(serializer_libraries GLOBAL PROPERTY MSG_SERIALIZER_LIBRARIES)
+    if(serializer_libraries)
+        target_link_libraries(${target_name} PRIVATE ${serializer_libraries})
+    endif()
 endfunction()
 
 # Export the functions
@@ -1,10 +1,30 @@
 __version__ = "0.0.0"
 __author__ = "Developer"
 
-from .module.dynamic_serializer_generator import DynamicCodeGenerator
-from .module.dynamic_type_generator import DynamicTypeGenerator
+import importlib
 
 __all__ = [
     'DynamicCodeGenerator',
     'DynamicTypeGenerator',
-]
\ No newline at end of file
+    'ShmRingReader',
+    'render_serializers',
+    'write_generated_files',
+]
+
+
+# Generators are imported on first use so that thin clients of the
+# generator server do not pay for importing Jinja2
+_lazy_attributes = {
+    'DynamicCodeGenerator': '.module.dynamic_serializer_generator',
+    'DynamicTypeGenerator': '.module.dynamic_type_generator',
+    'ShmRingReader': '.module.shm_ring_reader',
+    'render_serializers': '.rosmsg_to_serializer',
+    'write_generated_files': '.module.generated_files',
+}
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        module = importlib.import_module(_lazy_attributes[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
 
+import sys
+
 from .rosmsg_to_serializer import main
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
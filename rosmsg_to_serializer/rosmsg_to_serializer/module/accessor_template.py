@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+# Shared by the header and the per-type skip function fragments
+_SKIP_MACROS = '''{%- macro skip_element(field) -%}
+{%- if field.is_string -%}
+msg_access_skip_string(buffer, buffer_size, offset)
+{%- else -%}
+skip_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields(buffer, buffer_size, offset)
+{%- endif -%}
+{%- endmacro %}
+
+{%- macro skip_steps(steps) %}
+{%- for step in steps %}
+{%- if step is number %}
+    offset += {{ step }};
+{%- elif step.field.is_dynamic_array and step.element_size is not none %}
+    // Skip sequence: {{ step.field.name }}
+    offset = msg_access_skip_sequence(buffer, buffer_size, offset, {{ step.element_size }});
+    if (offset == 0) return 0;
+{%- elif step.field.is_dynamic_array %}
+    // Skip sequence: {{ step.field.name }}
+    {
+        uint32_t count;
+        offset = msg_access_read_length(buffer, buffer_size, offset, &count);
+        // Every element takes at least a length prefix, which bounds the loop
+        if (offset == 0 || count > (buffer_size - offset) / sizeof(uint32_t)) return 0;
+        for (uint32_t i = 0; i < count && offset != 0; ++i) {
+            offset = {{ skip_element(step.field) }};
+        }
+    }
+    if (offset == 0) return 0;
+{%- elif step.field.is_array %}
+    // Skip fixed array: {{ step.field.name }}
+    for (int i = 0; i < {{ step.field.array_size }} && offset != 0; ++i) {
+        offset = {{ skip_element(step.field) }};
+    }
+    if (offset == 0) return 0;
+{%- else %}
+    // Skip field: {{ step.field.name }}
+    offset = {{ skip_element(step.field) }};
+    if (offset == 0) return 0;
+{%- endif %}
+{%- endfor %}
+{%- endmacro %}'''
+
+
+def get_dynamic_accessor_template() -> str:
+    return '''#ifndef ACCESS_{{ message.c_type.upper() }}_H_
+#define ACCESS_{{ message.c_type.upper() }}_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include "common/serialize_utils.h"
+#include "common/serialize_access.h"
+
+{%- for msg_info in skip_types %}
+// Forward declaration for skipping over {{ msg_info.full_name }}
+static size_t skip_{{ message.c_type.lower() }}_{{ msg_info.c_type.lower() }}_fields(const uint8_t* buffer, size_t buffer_size, size_t offset);
+{%- endfor %}
+
+''' + _SKIP_MACROS + '''
+
+{%- for msg_info in skip_types %}
+{{- fragments[msg_info.full_name] }}
+{%- endfor %}
+
+{%- if wire_size != 0 %}
+
+// Serialized length of the {{ message.full_name }} at the start of buffer, or 0 if it is truncated
+static inline size_t get_{{ message.c_type.lower() }}_wire_length(const uint8_t* buffer, size_t buffer_size)
+{
+{%- if wire_size is none %}
+    return skip_{{ message.c_type.lower() }}_{{ message.c_type.lower() }}_fields(buffer, buffer_size, 0);
+{%- else %}
+    (void)buffer;
+    return buffer_size >= {{ wire_size }} ? {{ wire_size }} : 0;
+{%- endif %}
+}
+{%- endif %}
+
+{%- for accessor in accessors %}
+{%- set field = accessor.field %}
+{%- if field.is_string %}
+
+// String field {{ accessor.path }}: points data at the bytes in buffer (NUL-terminated), length excludes the NUL
+static inline size_t get_{{ message.c_type.lower() }}_{{ accessor.name }}(const uint8_t* buffer, size_t buffer_size, const char** data, size_t* length)
+{%- elif field.is_array %}
+
+// {% if field.is_dynamic_array %}Sequence{% else %}Fixed array{% endif %} field {{ accessor.path }}: points data at the big-endian elements in buffer
+static inline size_t get_{{ message.c_type.lower() }}_{{ accessor.name }}(const uint8_t* buffer, size_t buffer_size, const uint8_t** data, size_t* count)
+{%- else %}
+
+// Scalar field {{ accessor.path }}
+static inline size_t get_{{ message.c_type.lower() }}_{{ accessor.name }}(const uint8_t* buffer, size_t buffer_size, {{ field.c_type }}* value)
+{%- endif %}
+{
+    size_t offset = {{ accessor.offset }};
+{{- skip_steps(accessor.steps) }}
+{%- if field.is_string %}
+    return msg_access_string(buffer, buffer_size, offset, data, length);
+{%- elif field.is_dynamic_array %}
+    return msg_access_sequence(buffer, buffer_size, offset, {{ field.size }}, data, count);
+{%- elif field.is_array %}
+    if (offset > buffer_size || buffer_size - offset < {{ field.size * field.array_size }}) return 0;
+    *data = buffer + offset;
+    *count = {{ field.array_size }};
+    return offset + {{ field.size * field.array_size }};
+{%- else %}
+    if (offset > buffer_size || buffer_size - offset < {{ field.size }}) return 0;
+    {%- if field.size == 1 %}
+    *value = buffer[offset];
+    {%- elif field.size == 2 %}
+    *value = deserialize_u16_be(buffer + offset);
+    {%- elif field.size == 4 %}
+    store_u32_bits(value, deserialize_u32_be(buffer + offset));
+    {%- elif field.size == 8 %}
+    store_u64_bits(value, deserialize_u64_be(buffer + offset));
+    {%- endif %}
+    return offset + {{ field.size }};
+{%- endif %}
+}
+{%- endfor %}
+
+{%- if short_names and (wire_size != 0 or accessors) %}
+
+// Short-name aliases, kept while no other generated message is named {{ message.name }}
+{%- if wire_size != 0 %}
+static inline size_t get_{{ message.name.lower() }}_wire_length(const uint8_t* buffer, size_t buffer_size)
+{
+    return get_{{ message.c_type.lower() }}_wire_length(buffer, buffer_size);
+}
+{%- endif %}
+{%- for accessor in accessors %}
+{%- set field = accessor.field %}
+{%- if field.is_string %}
+
+static inline size_t get_{{ message.name.lower() }}_{{ accessor.name }}(const uint8_t* buffer, size_t buffer_size, const char** data, size_t* length)
+{
+    return get_{{ message.c_type.lower() }}_{{ accessor.name }}(buffer, buffer_size, data, length);
+}
+{%- elif field.is_array %}
+
+static inline size_t get_{{ message.name.lower() }}_{{ accessor.name }}(const uint8_t* buffer, size_t buffer_size, const uint8_t** data, size_t* count)
+{
+    return get_{{ message.c_type.lower() }}_{{ accessor.name }}(buffer, buffer_size, data, count);
+}
+{%- else %}
+
+static inline size_t get_{{ message.name.lower() }}_{{ accessor.name }}(const uint8_t* buffer, size_t buffer_size, {{ field.c_type }}* value)
+{
+    return get_{{ message.c_type.lower() }}_{{ accessor.name }}(buffer, buffer_size, value);
+}
+{%- endif %}
+{%- endfor %}
+{%- endif %}
+
+#endif // ACCESS_{{ message.c_type.upper() }}_H_
+'''
+
+
+def get_dynamic_skip_fragment_template() -> str:
+    # Skip function for one type in the closure; rendered once per type and shared by every header
+    return _SKIP_MACROS + '''
+
+// Skip over a serialized {{ msg_info.full_name }} without decoding it
+static size_t skip_{{ prefix }}_{{ msg_info.c_type.lower() }}_fields(const uint8_t* buffer, size_t buffer_size, size_t offset)
+{
+{{- skip_steps(steps) }}
+
+    if (offset > buffer_size) return 0;
+    return offset;
+}
+'''
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+from typing import Dict, Any, List
+
+
+# Trailer checksums supported by --crc; parameters follow the usual CRC catalogue naming
+CRC_ALGORITHMS: Dict[str, Dict[str, Any]] = {
+    'crc32': {
+        'name': 'CRC-32',
+        'width': 32,
+        'polynomial': 0x04C11DB7,
+        'init': 0xFFFFFFFF,
+        'xorout': 0xFFFFFFFF,
+        'reflected': True,
+    },
+    'crc16': {
+        'name': 'CRC-16/CCITT-FALSE',
+        'width': 16,
+        'polynomial': 0x1021,
+        'init': 0xFFFF,
+        'xorout': 0x0000,
+        'reflected': False,
+    },
+}
+
+
+def get_crc_algorithm(algorithm: str) -> Dict[str, Any]:
+    if algorithm not in CRC_ALGORITHMS:
+        raise ValueError(f"Unknown CRC algorithm: {algorithm} (expected one of {', '.join(CRC_ALGORITHMS)})")
+    return CRC_ALGORITHMS[algorithm]
+
+
+def crc_table(algorithm: str) -> List[int]:
+    # Byte-wise lookup table for the generated C code
+    params = get_crc_algorithm(algorithm)
+    width = params['width']
+    mask = (1 << width) - 1
+    table = []
+    if params['reflected']:
+        polynomial = _reflect(params['polynomial'], width)
+        for byte in range(256):
+            value = byte
+            for _ in range(8):
+                value = (value >> 1) ^ polynomial if value & 1 else value >> 1
+            table.append(value)
+    else:
+        top_bit = 1 << (width - 1)
+        for byte in range(256):
+            value = byte << (width - 8)
+            for _ in range(8):
+                value = ((value << 1) ^ params['polynomial']) & mask if value & top_bit else (value << 1) & mask
+            table.append(value)
+    return table
+
+
+def compute_crc(algorithm: str, data: bytes) -> int:
+    # Reference implementation matching common/serialize_crc.h
+    params = get_crc_algorithm(algorithm)
+    width = params['width']
+    mask = (1 << width) - 1
+    table = crc_table(algorithm)
+    value = params['init']
+    for byte in data:
+        if params['reflected']:
+            value = table[(value ^ byte) & 0xFF] ^ (value >> 8)
+        else:
+            value = table[((value >> (width - 8)) ^ byte) & 0xFF] ^ ((value << 8) & mask)
+    return value ^ params['xorout']
+
+
+def _reflect(value: int, width: int) -> int:
+    result = 0
+    for _ in range(width):
+        result = (result << 1) | (value & 1)
+        value >>= 1
+    return result
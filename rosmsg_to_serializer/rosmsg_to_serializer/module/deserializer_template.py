@@ -1,21 +1,83 @@
 #!/usr/bin/env python3
 
 def get_dynamic_deserializer_template() -> str:
-    return '''#ifndef DESERIALIZE_{{ message.name.upper() }}_H_
-#define DESERIALIZE_{{ message.name.upper() }}_H_
+    return '''#ifndef DESERIALIZE_{{ message.c_type.upper() }}_H_
+#define DESERIALIZE_{{ message.c_type.upper() }}_H_
 // TEMPLATE_MARKER: UPDATED_TEMPLATE_V2
 
 #include <stddef.h>
 #include <stdint.h>
 #include <stdlib.h>
 #include "common/serialize_utils.h"
+{%- if crc %}
+#include "common/serialize_crc.h"
+{%- endif %}
 
 {%- for msg_type, msg_info in all_messages.items() %}
 // Forward declaration for deserializer of {{ msg_type }}
-static size_t deserialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower() }}_fields(const uint8_t* buffer, size_t buffer_size, size_t offset, {{ msg_info.c_type }}* msg, char* string_buffer, size_t string_buffer_size);
+static size_t deserialize_{{ message.c_type.lower() }}_{{ msg_info.c_type.lower() }}_fields(const uint8_t* buffer, size_t buffer_size, size_t offset, {{ msg_info.c_type }}* msg, char* string_buffer, size_t string_buffer_size{% if crc %}, msg_crc_state* crc{% endif %});
+{%- endfor %}
+
+{%- for msg_type in all_messages %}
+{{- fragments[msg_type] }}
 {%- endfor %}
 
-{%- macro deserialize_field_dynamic(field, var_name, buffer_name, offset_name) %}
+// Main deserializer function
+// Note: String fields allocate individual memory blocks that must be freed by the caller.
+// On failure (0) fields decoded so far may already hold allocated memory; start from a
+// zero-initialized msg so every pointer left behind is either allocated or NULL.
+static inline size_t deserialize_{{ message.c_type.lower() }}_big_endian(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    (void)max_string_buffer_size; // Not used with individual string allocation
+    // Pass NULL for string_buffer since we allocate individually for each string
+    size_t result = deserialize_{{ message.c_type.lower() }}_{{ message.c_type.lower() }}_fields(buffer, buffer_size, 0, msg, NULL, 0{% if crc %}, NULL{% endif %});
+    return result;
+}
+{%- if crc %}
+
+// Deserializer for buffers carrying a {{ crc_name }} trailer, checksummed while the fields are read.
+// Returns 0 if the trailer does not match; as with other failures, fields decoded so far may
+// already hold allocated memory.
+static inline size_t deserialize_{{ message.c_type.lower() }}_big_endian_crc(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    (void)max_string_buffer_size; // Not used with individual string allocation
+    if (buffer == NULL || buffer_size < MSG_CRC_TRAILER_SIZE) return 0;
+    
+    msg_crc_state crc;
+    msg_crc_init(&crc);
+    
+    size_t offset = deserialize_{{ message.c_type.lower() }}_{{ message.c_type.lower() }}_fields(buffer, buffer_size - MSG_CRC_TRAILER_SIZE, 0, msg, NULL, 0, &crc);
+    if (offset == 0) return 0;
+    
+    msg_crc_advance(&crc, buffer, offset);
+    if (msg_crc_read_trailer(buffer + offset) != msg_crc_finish(&crc)) return 0;
+    return offset + MSG_CRC_TRAILER_SIZE;
+}
+{%- endif %}
+
+{%- if short_names %}
+
+// Short-name aliases, kept while no other generated message is named {{ message.name }}
+static inline size_t deserialize_{{ message.name.lower() }}_big_endian(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    return deserialize_{{ message.c_type.lower() }}_big_endian(buffer, buffer_size, msg, max_string_buffer_size);
+}
+{%- if crc %}
+
+static inline size_t deserialize_{{ message.name.lower() }}_big_endian_crc(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    return deserialize_{{ message.c_type.lower() }}_big_endian_crc(buffer, buffer_size, msg, max_string_buffer_size);
+}
+{%- endif %}
+{%- endif %}
+
+#endif // DESERIALIZE_{{ message.c_type.upper() }}_H_
+'''
+
+
+def get_dynamic_deserializer_fragment_template() -> str:
+    # Functions for one type in the closure; rendered once per type and shared by every header
+    return '''{%- macro deserialize_field_dynamic(field, var_name, buffer_name, offset_name) %}
 {%- if field.is_string %}
     // String field: {{ field.name }}
     if ({{ offset_name }} + sizeof(uint32_t) > buffer_size) return 0;
@@ -23,7 +85,7 @@ static size_t deserialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower()
     uint32_t {{ field.name }}_len_with_null = deserialize_u32_be({{ buffer_name }} + {{ offset_name }});
     {{ offset_name }} += sizeof(uint32_t);
     
-    if ({{ offset_name }} + {{ field.name }}_len_with_null > buffer_size) return 0;
+    if ({{ field.name }}_len_with_null == 0 || {{ field.name }}_len_with_null > buffer_size - {{ offset_name }}) return 0;
     
     // Allocate individual memory for this string field
     char* {{ field.name }}_string_buffer = (char*)malloc({{ field.name }}_len_with_null);
@@ -36,47 +98,87 @@ static size_t deserialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower()
     {{ var_name }}->{{ field.name }}.size = {{ field.name }}_len_with_null - 1;
     {{ var_name }}->{{ field.name }}.capacity = {{ field.name }}_len_with_null;
     {{ offset_name }} += {{ field.name }}_len_with_null;
-{%- elif field.is_dynamic_array %}
-    // Dynamic array field: {{ field.name }}
+{%- elif field.is_dynamic_array and field.is_builtin and field.size == 1 %}
+    // Byte sequence field: {{ field.name }}
     if ({{ offset_name }} + sizeof(uint32_t) > buffer_size) return 0;
     
     uint32_t {{ field.name }}_size = deserialize_u32_be({{ buffer_name }} + {{ offset_name }});
     {{ offset_name }} += sizeof(uint32_t);
     
-    // Allocate memory for dynamic array elements
+    if ({{ field.name }}_size > buffer_size - {{ offset_name }}) return 0;
+    
     {{ var_name }}->{{ field.name }}.size = {{ field.name }}_size;
     {{ var_name }}->{{ field.name }}.capacity = {{ field.name }}_size;
     if ({{ field.name }}_size > 0) {
-        {{ var_name }}->{{ field.name }}.data = ({{ field.c_type }}*)malloc({{ field.name }}_size * sizeof({{ field.c_type }}));
+        {{ var_name }}->{{ field.name }}.data = ({{ field.c_type }}*)malloc({{ field.name }}_size);
         if ({{ var_name }}->{{ field.name }}.data == NULL) {
             return 0; // Memory allocation failed
         }
+        {%- if crc %}
+        if (crc != NULL) {
+            // Copy and checksum the payload in a single pass
+            msg_crc_advance(crc, {{ buffer_name }}, {{ offset_name }});
+            msg_crc_copy(crc, (uint8_t*){{ var_name }}->{{ field.name }}.data, {{ buffer_name }} + {{ offset_name }}, {{ field.name }}_size);
+        } else {
+            virt_memcpy((uint8_t*){{ var_name }}->{{ field.name }}.data, {{ buffer_name }} + {{ offset_name }}, {{ field.name }}_size);
+        }
+        {%- else %}
+        virt_memcpy((uint8_t*){{ var_name }}->{{ field.name }}.data, {{ buffer_name }} + {{ offset_name }}, {{ field.name }}_size);
+        {%- endif %}
     } else {
         {{ var_name }}->{{ field.name }}.data = NULL;
     }
+    {{ offset_name }} += {{ field.name }}_size;
+{%- elif field.is_dynamic_array %}
+    // Dynamic array field: {{ field.name }}
+    if ({{ offset_name }} + sizeof(uint32_t) > buffer_size) return 0;
+    
+    uint32_t {{ field.name }}_size = deserialize_u32_be({{ buffer_name }} + {{ offset_name }});
+    {{ offset_name }} += sizeof(uint32_t);
+    {%- if min_element_sizes[field.name] %}
+    
+    // Reject counts the remaining buffer cannot hold before allocating for them
+    if ({{ field.name }}_size > (buffer_size - {{ offset_name }}) / {{ min_element_sizes[field.name] }}) return 0;
+    {%- endif %}
+    
+    // Allocate memory for dynamic array elements
+    {%- if not field.is_builtin %}
+    // Zeroed, so elements left undecoded by a truncated buffer hold no stray pointers
+    {%- endif %}
+    {{ var_name }}->{{ field.name }}.data = NULL;
+    {{ var_name }}->{{ field.name }}.size = 0;
+    {{ var_name }}->{{ field.name }}.capacity = 0;
+    if ({{ field.name }}_size > 0) {
+        {%- if field.is_builtin %}
+        {{ var_name }}->{{ field.name }}.data = ({{ field.c_type }}*)malloc({{ field.name }}_size * sizeof({{ field.c_type }}));
+        {%- else %}
+        {{ var_name }}->{{ field.name }}.data = ({{ field.c_type }}*)calloc({{ field.name }}_size, sizeof({{ field.c_type }}));
+        {%- endif %}
+        if ({{ var_name }}->{{ field.name }}.data == NULL) {
+            return 0; // Memory allocation failed
+        }
+    }
+    {{ var_name }}->{{ field.name }}.size = {{ field.name }}_size;
+    {{ var_name }}->{{ field.name }}.capacity = {{ field.name }}_size;
     
     for (uint32_t i = 0; i < {{ field.name }}_size; ++i) {
         {%- if field.is_builtin %}
-        {%- if field.size == 1 %}
-        if ({{ offset_name }} + 1 > buffer_size) return 0;
-        {{ var_name }}->{{ field.name }}.data[i] = {{ buffer_name }}[{{ offset_name }}];
-        {{ offset_name }} += 1;
-        {%- elif field.size == 2 %}
+        {%- if field.size == 2 %}
         if ({{ offset_name }} + 2 > buffer_size) return 0;
         {{ var_name }}->{{ field.name }}.data[i] = deserialize_u16_be({{ buffer_name }} + {{ offset_name }});
         {{ offset_name }} += 2;
         {%- elif field.size == 4 %}
         if ({{ offset_name }} + 4 > buffer_size) return 0;
-        *(uint32_t*)&{{ var_name }}->{{ field.name }}.data[i] = deserialize_u32_be({{ buffer_name }} + {{ offset_name }});
+        store_u32_bits(&{{ var_name }}->{{ field.name }}.data[i], deserialize_u32_be({{ buffer_name }} + {{ offset_name }}));
         {{ offset_name }} += 4;
         {%- elif field.size == 8 %}
         if ({{ offset_name }} + 8 > buffer_size) return 0;
-        *(uint64_t*)&{{ var_name }}->{{ field.name }}.data[i] = deserialize_u64_be({{ buffer_name }} + {{ offset_name }});
+        store_u64_bits(&{{ var_name }}->{{ field.name }}.data[i], deserialize_u64_be({{ buffer_name }} + {{ offset_name }}));
         {{ offset_name }} += 8;
         {%- endif %}
         {%- else %}
         // Nested message in array: {{ field.nested_message.name }}
-        size_t {{ field.name }}_nested_result = deserialize_{{ message.c_type.lower() }}_{{ field.nested_message.name.lower() }}_fields({{ buffer_name }}, buffer_size, {{ offset_name }}, &{{ var_name }}->{{ field.name }}.data[i], string_buffer, string_buffer_size);
+        size_t {{ field.name }}_nested_result = deserialize_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields({{ buffer_name }}, buffer_size, {{ offset_name }}, &{{ var_name }}->{{ field.name }}.data[i], string_buffer, string_buffer_size{% if crc %}, crc{% endif %});
         if ({{ field.name }}_nested_result == 0) return 0;
         {{ offset_name }} = {{ field.name }}_nested_result;
         {%- endif %}
@@ -99,20 +201,20 @@ static size_t deserialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower()
     {%- elif field.size == 4 %}
     if ({{ offset_name }} + {{ field.array_size * 4 }} > buffer_size) return 0;
     for (int i = 0; i < {{ field.array_size }}; ++i) {
-        *(uint32_t*)&{{ var_name }}->{{ field.name }}[i] = deserialize_u32_be({{ buffer_name }} + {{ offset_name }});
+        store_u32_bits(&{{ var_name }}->{{ field.name }}[i], deserialize_u32_be({{ buffer_name }} + {{ offset_name }}));
         {{ offset_name }} += 4;
     }
     {%- elif field.size == 8 %}
     if ({{ offset_name }} + {{ field.array_size * 8 }} > buffer_size) return 0;
     for (int i = 0; i < {{ field.array_size }}; ++i) {
-        *(uint64_t*)&{{ var_name }}->{{ field.name }}[i] = deserialize_u64_be({{ buffer_name }} + {{ offset_name }});
+        store_u64_bits(&{{ var_name }}->{{ field.name }}[i], deserialize_u64_be({{ buffer_name }} + {{ offset_name }}));
         {{ offset_name }} += 8;
     }
     {%- endif %}
     {%- else %}
     // Nested message array: {{ field.nested_message.name }}
     for (int i = 0; i < {{ field.array_size }}; ++i) {
-        size_t {{ field.name }}_nested_result = deserialize_{{ message.c_type.lower() }}_{{ field.nested_message.name.lower() }}_fields({{ buffer_name }}, buffer_size, {{ offset_name }}, &{{ var_name }}->{{ field.name }}[i], string_buffer, string_buffer_size);
+        size_t {{ field.name }}_nested_result = deserialize_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields({{ buffer_name }}, buffer_size, {{ offset_name }}, &{{ var_name }}->{{ field.name }}[i], string_buffer, string_buffer_size{% if crc %}, crc{% endif %});
         if ({{ field.name }}_nested_result == 0) return 0;
         {{ offset_name }} = {{ field.name }}_nested_result;
     }
@@ -130,25 +232,23 @@ static size_t deserialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower()
     {{ offset_name }} += 2;
     {%- elif field.size == 4 %}
     if ({{ offset_name }} + 4 > buffer_size) return 0;
-    *(uint32_t*)&{{ var_name }}->{{ field.name }} = deserialize_u32_be({{ buffer_name }} + {{ offset_name }});
+    store_u32_bits(&{{ var_name }}->{{ field.name }}, deserialize_u32_be({{ buffer_name }} + {{ offset_name }}));
     {{ offset_name }} += 4;
     {%- elif field.size == 8 %}
     if ({{ offset_name }} + 8 > buffer_size) return 0;
-    *(uint64_t*)&{{ var_name }}->{{ field.name }} = deserialize_u64_be({{ buffer_name }} + {{ offset_name }});
+    store_u64_bits(&{{ var_name }}->{{ field.name }}, deserialize_u64_be({{ buffer_name }} + {{ offset_name }}));
     {{ offset_name }} += 8;
     {%- endif %}
     {%- else %}
     // Nested message: {{ field.nested_message.name }}
-    size_t {{ field.name }}_nested_result = deserialize_{{ message.c_type.lower() }}_{{ field.nested_message.name.lower() }}_fields({{ buffer_name }}, buffer_size, {{ offset_name }}, &{{ var_name }}->{{ field.name }}, string_buffer, string_buffer_size);
+    size_t {{ field.name }}_nested_result = deserialize_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields({{ buffer_name }}, buffer_size, {{ offset_name }}, &{{ var_name }}->{{ field.name }}, string_buffer, string_buffer_size{% if crc %}, crc{% endif %});
     if ({{ field.name }}_nested_result == 0) return 0;
     {{ offset_name }} = {{ field.name }}_nested_result;
     {%- endif %}
 {%- endif %}
 {%- endmacro %}
-
-{%- for msg_type, msg_info in all_messages.items() %}
 // Deserializer for {{ msg_type }}
-static size_t deserialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower() }}_fields(const uint8_t* buffer, size_t buffer_size, size_t offset, {{ msg_info.c_type }}* msg, char* string_buffer, size_t string_buffer_size)
+static size_t deserialize_{{ prefix }}_{{ msg_info.c_type.lower() }}_fields(const uint8_t* buffer, size_t buffer_size, size_t offset, {{ msg_info.c_type }}* msg, char* string_buffer, size_t string_buffer_size{% if crc %}, msg_crc_state* crc{% endif %})
 {
     (void)string_buffer;  // Unused in this context, but can be used for string fields
     (void)string_buffer_size;  // Unused in this context, but can be used for string fields
@@ -159,21 +259,11 @@ static size_t deserialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower()
     
 {%- for field in msg_info.fields %}
     {{ deserialize_field_dynamic(field, "msg", "buffer", "offset") }}
+    {%- if crc %}
+    if (crc != NULL) msg_crc_advance(crc, buffer, offset);
+    {%- endif %}
 {%- endfor %}
     
     return offset;
 }
-{%- endfor %}
-
-// Main deserializer function
-// Note: String fields allocate individual memory blocks that must be freed by the caller
-size_t deserialize_{{ message.name.lower() }}_big_endian(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
-{
-    (void)max_string_buffer_size; // Not used with individual string allocation
-    // Pass NULL for string_buffer since we allocate individually for each string
-    size_t result = deserialize_{{ message.c_type.lower() }}_{{ message.name.lower() }}_fields(buffer, buffer_size, 0, msg, NULL, 0);
-    return result;
-}
-
-#endif // DESERIALIZE_{{ message.name.upper() }}_H_
-'''
\ No newline at end of file
+'''
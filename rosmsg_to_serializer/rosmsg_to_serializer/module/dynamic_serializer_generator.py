@@ -4,16 +4,28 @@ import os
 import sys
 import json
 import importlib
-from typing import Dict, Any, List, Tuple, Optional, Union
+from typing import Dict, Any, List, Set, Tuple, Optional, Union
 from jinja2 import Environment, FileSystemLoader
 from pathlib import Path
-from .serializer_template import get_dynamic_serializer_template
-from .deserializer_template import get_dynamic_deserializer_template
+from .serializer_template import get_dynamic_serializer_template, get_dynamic_serializer_fragment_template
+from .deserializer_template import get_dynamic_deserializer_template, get_dynamic_deserializer_fragment_template
+from .iovec_serializer_template import get_dynamic_iovec_serializer_template, get_dynamic_iovec_serializer_fragment_template
+from .accessor_template import get_dynamic_accessor_template, get_dynamic_skip_fragment_template
+from .shm_ring_template import get_shm_ring_template
+from .python_bindings_template import get_python_bindings_library_template, get_python_bindings_module_template
+from .table_codec_template import get_table_descriptor_template, get_table_serializer_template, get_table_deserializer_template
+from .generated_files import write_generated_files
+from .crc_algorithms import get_crc_algorithm
+
+
+# Stands in for the top-level message prefix of static function names in cached fragments
+FRAGMENT_PREFIX = '@MSG_PREFIX@'
 
 
 class DynamicMessageAnalyzer:
     def __init__(self):
         self.analyzed_types = {}
+        self.dependency_cache = {}
         self.builtin_types = {
             'boolean', 'bool', 'byte', 'char', 'float32', 'float64', 'double', 'float',
             'int8', 'uint8', 'int16', 'uint16', 'int32', 'uint32', 
@@ -42,6 +54,7 @@ class DynamicMessageAnalyzer:
         }
         
         self.type_sizes = {
+            'boolean': 1,
             'bool': 1,
             'byte': 1,
             'char': 1,
@@ -86,6 +99,7 @@ class DynamicMessageAnalyzer:
                 'name': message_name,
                 'full_name': full_message_type,
                 'c_type': f"{package_name}__msg__{message_name}",
+                'definition_file': self._find_definition_file(package_name, message_name, message_class),
                 'fields': []
             }
             
@@ -99,6 +113,22 @@ class DynamicMessageAnalyzer:
         except (ImportError, AttributeError) as e:
             raise ValueError(f"Could not analyze message type {message_type}: {e}")
     
+    def _find_definition_file(self, package_name: str, message_name: str, message_class) -> Optional[str]:
+        # Prefer the installed .msg definition; fall back to the generated Python module
+        try:
+            from ament_index_python.packages import get_package_share_directory
+            msg_file = Path(get_package_share_directory(package_name)) / 'msg' / f"{message_name}.msg"
+            if msg_file.exists():
+                return str(msg_file)
+        except (ImportError, LookupError, ValueError):
+            pass
+        
+        module = sys.modules.get(message_class.__module__)
+        module_file = getattr(module, '__file__', None)
+        if module_file:
+            return str(Path(module_file).resolve())
+        return None
+    
     def _analyze_field(self, field_name: str, field_type: str) -> Dict[str, Any]:
         field_info = {
             'name': field_name,
@@ -157,32 +187,329 @@ class DynamicMessageAnalyzer:
         
         return field_info
     
+    def get_nested_types(self, message_type: str) -> List[str]:
+        # Direct nested message types, in field order
+        analyzed = self.analyze_message_type(message_type)
+        if 'nested_types' not in analyzed:
+            nested_types = {}
+            for field in analyzed['fields']:
+                if field['nested_message']:
+                    nested_types[field['nested_message']['full_name']] = True
+            analyzed['nested_types'] = list(nested_types)
+        return analyzed['nested_types']
+    
     def get_all_dependencies(self, message_type: str) -> List[str]:
-        dependencies = []
         analyzed = self.analyze_message_type(message_type)
+        full_name = analyzed['full_name']
+        if full_name in self.dependency_cache:
+            return list(self.dependency_cache[full_name])
         
-        def collect_dependencies(msg_info):
-            for field in msg_info['fields']:
-                if field['nested_message']:
-                    nested_type = field['nested_message']['full_name']
-                    if nested_type not in dependencies:
-                        dependencies.append(nested_type)
-                        collect_dependencies(field['nested_message'])
+        # Iterative pre-order walk; same order as a recursive field-by-field traversal
+        dependencies = []
+        seen = set()
+        stack = [iter(self.get_nested_types(full_name))]
+        while stack:
+            for nested_type in stack[-1]:
+                if nested_type not in seen:
+                    seen.add(nested_type)
+                    dependencies.append(nested_type)
+                    stack.append(iter(self.get_nested_types(nested_type)))
+                    break
+            else:
+                stack.pop()
+        
+        self.dependency_cache[full_name] = dependencies
+        return list(dependencies)
+    
+    def get_dependency_closure(self, message_types: List[str]) -> Set[str]:
+        # Full names of message_types and everything they depend on, visiting each type once
+        closure = set()
+        pending = []
+        for msg_type in message_types:
+            full_name = self.analyze_message_type(msg_type)['full_name']
+            if full_name not in closure:
+                closure.add(full_name)
+                pending.append(full_name)
+        
+        while pending:
+            for nested_type in self.get_nested_types(pending.pop()):
+                if nested_type not in closure:
+                    closure.add(nested_type)
+                    pending.append(nested_type)
+        
+        return closure
+    
+    def discover_package_messages(self, package_name: str) -> List[str]:
+        # Every message class exported by <package>.msg, sorted by name
+        try:
+            package = importlib.import_module(f"{package_name}.msg")
+        except ImportError as e:
+            raise ValueError(f"Could not import messages of package {package_name}: {e}")
         
-        collect_dependencies(analyzed)
-        return dependencies
+        message_types = []
+        for name in sorted(dir(package)):
+            message_class = getattr(package, name)
+            if isinstance(message_class, type) and hasattr(message_class, 'get_fields_and_field_types'):
+                message_types.append(f"{package_name}/msg/{name}")
+        return message_types
 
 
 class DynamicCodeGenerator:
-    def __init__(self, template_dir: str):
+    def __init__(self, template_dir: str, analyzer: Optional[DynamicMessageAnalyzer] = None):
         self.template_dir = Path(template_dir)
         self.env = Environment(loader=FileSystemLoader(str(self.template_dir)))
-        self.analyzer = DynamicMessageAnalyzer()
+        self.analyzer = analyzer if analyzer is not None else DynamicMessageAnalyzer()
+        self.compiled_templates = {}
+        self.fragment_cache = {}
+        self.wire_size_cache = {}
+        self.min_wire_size_cache = {}
     
-    def generate_serializer(self, message_type: str, output_dir: str):
-        output_path = Path(output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
+    def generate_serializer(self, message_type: str, output_dir: str, crc: Optional[str] = None):
+        write_generated_files(self.render_serializer(message_type, crc=crc), output_dir)
+    
+    def generate_iovec_serializer(self, message_type: str, output_dir: str):
+        write_generated_files(self.render_iovec_serializer(message_type), output_dir)
+    
+    def render_serializer(self, message_type: str, crc: Optional[str] = None, short_names: bool = True) -> Dict[str, str]:
+        # short_names also emits the unqualified entry points (serialize_<name>_big_endian, ...) as
+        # aliases; pass False when another generated message has the same short name
+        analyzed_message, all_messages = self._collect_messages(message_type)
+        msg_dir = f"{analyzed_message['package']}/{analyzed_message['name']}"
+        
+        return {
+            f"{msg_dir}/serialize.h": self._generate_dynamic_serializer(analyzed_message, all_messages, crc=crc, short_names=short_names),
+            f"{msg_dir}/deserialize.h": self._generate_dynamic_deserializer(analyzed_message, all_messages, crc=crc, short_names=short_names),
+        }
+    
+    def render_iovec_serializer(self, message_type: str, short_names: bool = True) -> Dict[str, str]:
+        analyzed_message, all_messages = self._collect_messages(message_type)
+        msg_dir = f"{analyzed_message['package']}/{analyzed_message['name']}"
+        
+        return {
+            f"{msg_dir}/serialize_iovec.h": self._generate_dynamic_iovec_serializer(analyzed_message, all_messages, short_names=short_names),
+        }
+    
+    def render_table_serializer(self, message_type: str, crc: Optional[str] = None, short_names: bool = True) -> Dict[str, str]:
+        # Compact descriptor tables driven by the generic interpreter in common/table_codec.h
+        analyzed_message, all_messages = self._collect_messages(message_type)
+        msg_dir = f"{analyzed_message['package']}/{analyzed_message['name']}"
+        crc_context = self._crc_context(crc)
+        
+        files = {
+            f"{msg_dir}/serialize.h": self._get_template('table_serializer', get_table_serializer_template).render(message=analyzed_message, short_names=short_names, **crc_context),
+            f"{msg_dir}/deserialize.h": self._get_template('table_deserializer', get_table_deserializer_template).render(message=analyzed_message, short_names=short_names, **crc_context),
+        }
         
+        descriptor_template = self._get_template('table_descriptor', get_table_descriptor_template)
+        for msg_info in all_messages.values():
+            # Shared by every table-driven message whose closure contains the type
+            key = ('descriptor', msg_info['full_name'])
+            if key not in self.fragment_cache:
+                self.fragment_cache[key] = descriptor_template.render(
+                    message=msg_info,
+                    wire_fields=[field for field in msg_info['fields'] if self._has_wire_representation(field)],
+                    min_wire_size=self._min_wire_size(msg_info),
+                    nested_types=[self.analyzer.analyze_message_type(nested_type) for nested_type in self.analyzer.get_nested_types(msg_info['full_name'])]
+                )
+            files[f"{msg_info['package']}/{msg_info['name']}/descriptor.h"] = self.fragment_cache[key]
+        
+        return files
+    
+    def render_accessors(self, message_type: str, short_names: bool = True) -> Dict[str, str]:
+        # In-place field accessors and wire length for {pkg}/{Name}/access.h
+        analyzed_message, all_messages = self._collect_messages(message_type)
+        
+        skip_types = {msg_info['full_name']: msg_info for msg_info in all_messages.values() if self._wire_size(msg_info) is None}
+        
+        content = self._get_template('accessors', get_dynamic_accessor_template).render(
+            message=analyzed_message,
+            prefix=analyzed_message['c_type'].lower(),
+            skip_types=list(skip_types.values()),
+            fragments=self._render_fragments('skip', get_dynamic_skip_fragment_template, analyzed_message, skip_types,
+                                             type_context=lambda msg_info: {'steps': self._wire_steps(msg_info)}),
+            accessors=self._collect_accessors(analyzed_message, [], []),
+            wire_size=self._wire_size(analyzed_message),
+            short_names=short_names
+        )
+        
+        return {f"{analyzed_message['package']}/{analyzed_message['name']}/access.h": content}
+    
+    def render_shm_ring(self, message_type: str, short_names: bool = True) -> Dict[str, str]:
+        analyzed_message = self.analyzer.analyze_message_type(message_type)
+        content = self._get_template('shm_ring', get_shm_ring_template).render(message=analyzed_message, short_names=short_names)
+        return {f"{analyzed_message['package']}/{analyzed_message['name']}/shm_ring.h": content}
+    
+    def render_python_bindings(self, message_types: List[str]) -> Dict[str, str]:
+        # ctypes bindings (python/msg_codecs.py) over a shared library built from python/msg_codecs.c
+        messages = [self.analyzer.analyze_message_type(msg_type) for msg_type in message_types]
+        codec_types = {message['full_name'] for message in messages}
+        
+        # ctypes needs every nested structure defined before the structures using it
+        binding_types = {}
+        for message in messages:
+            self._add_binding_type(message, codec_types, binding_types)
+        
+        context = {
+            'library_name': 'msg_serializer_codecs',
+            'library_env_var': 'MSG_SERIALIZER_CODECS_LIBRARY',
+            'example_type': messages[0]['full_name'] if messages else 'geometry_msgs/msg/Twist',
+        }
+        return {
+            'python/msg_codecs.c': self._get_template('python_bindings_library', get_python_bindings_library_template).render(messages=messages, **context),
+            'python/msg_codecs.py': self._get_template('python_bindings_module', get_python_bindings_module_template).render(
+                message_types=self._binding_types_literal(binding_types), **context),
+        }
+    
+    def _add_binding_type(self, msg_info: Dict[str, Any], codec_types: Set[str], binding_types: Dict[str, Any]):
+        if msg_info['full_name'] in binding_types:
+            return
+        for field in msg_info['fields']:
+            if field['nested_message']:
+                self._add_binding_type(field['nested_message'], codec_types, binding_types)
+        binding_types[msg_info['full_name']] = {
+            'full_name': msg_info['full_name'],
+            'name': msg_info['name'],
+            'c_type': msg_info['c_type'],
+            'codec': msg_info['full_name'] in codec_types,
+            'fields': [self._binding_field(field) for field in msg_info['fields']],
+        }
+    
+    def _binding_types_literal(self, binding_types: Dict[str, Any]) -> str:
+        # Python literal for MESSAGE_TYPES, one field per line
+        lines = ['{']
+        for full_name, binding in binding_types.items():
+            lines.append(f"    {full_name!r}: {{")
+            for key in ('full_name', 'name', 'c_type', 'codec'):
+                lines.append(f"        {key!r}: {binding[key]!r},")
+            lines.append("        'fields': [")
+            lines.extend(f"            {field!r}," for field in binding['fields'])
+            lines.append("        ],")
+            lines.append("    },")
+        lines.append('}')
+        return '\n'.join(lines)
+    
+    def _binding_field(self, field: Dict[str, Any]) -> Dict[str, Any]:
+        if field['nested_message']:
+            kind = 'nested'
+        elif field['is_string']:
+            kind = field['base_type']
+        else:
+            kind = 'scalar'
+        
+        if field['is_dynamic_array']:
+            array = 'sequence'
+        elif field['is_array']:
+            array = 'fixed'
+        else:
+            array = None
+        
+        return {
+            'name': field['name'],
+            'kind': kind,
+            'c_type': field['c_type'],
+            'array': array,
+            'array_size': field['array_size'],
+            'nested': field['nested_message']['full_name'] if field['nested_message'] else None,
+            'size': field['size'],
+        }
+    
+    def _wire_size(self, msg_info: Dict[str, Any]) -> Optional[int]:
+        # Constant serialized size of a message, or None if it has variable-length fields
+        full_name = msg_info['full_name']
+        if full_name not in self.wire_size_cache:
+            total = 0
+            for field in msg_info['fields']:
+                field_size = self._field_wire_size(field)
+                if field_size is None:
+                    total = None
+                    break
+                total += field_size
+            self.wire_size_cache[full_name] = total
+        return self.wire_size_cache[full_name]
+    
+    def _field_wire_size(self, field: Dict[str, Any]) -> Optional[int]:
+        if field['is_string'] or field['is_dynamic_array']:
+            return None
+        element_size = self._element_wire_size(field)
+        if element_size is None:
+            return None
+        return element_size * field['array_size'] if field['is_array'] else element_size
+    
+    def _element_wire_size(self, field: Dict[str, Any]) -> Optional[int]:
+        if field['is_string']:
+            return None
+        if field['is_builtin']:
+            return field['size'] or 0
+        return self._wire_size(field['nested_message'])
+    
+    def _min_wire_size(self, msg_info: Dict[str, Any]) -> int:
+        # Smallest serialized size of a message: empty strings and sequences cost their length prefix
+        full_name = msg_info['full_name']
+        if full_name not in self.min_wire_size_cache:
+            total = 0
+            for field in msg_info['fields']:
+                if field['is_dynamic_array']:
+                    total += 4
+                elif field['is_array']:
+                    total += self._min_element_wire_size(field) * field['array_size']
+                else:
+                    total += self._min_element_wire_size(field)
+            self.min_wire_size_cache[full_name] = total
+        return self.min_wire_size_cache[full_name]
+    
+    def _min_element_sizes_context(self, msg_info: Dict[str, Any]) -> Dict[str, Any]:
+        # Lets the deserializer bound sequence counts read from the wire before allocating
+        return {'min_element_sizes': {field['name']: self._min_element_wire_size(field) for field in msg_info['fields']}}
+    
+    def _min_element_wire_size(self, field: Dict[str, Any]) -> int:
+        if field['is_string']:
+            return 4
+        if field['is_builtin']:
+            return field['size'] or 0
+        return self._min_wire_size(field['nested_message'])
+    
+    def _wire_steps(self, msg_info: Dict[str, Any]) -> List[Any]:
+        # Fixed-size fields collapse into byte counts; variable-length fields become skip steps
+        steps = []
+        for field in msg_info['fields']:
+            self._append_wire_step(steps, field)
+        return steps
+    
+    def _append_wire_step(self, steps: List[Any], field: Dict[str, Any]):
+        field_size = self._field_wire_size(field)
+        if field_size is None:
+            steps.append({'field': field, 'element_size': self._element_wire_size(field)})
+        elif field_size:
+            if steps and isinstance(steps[-1], int):
+                steps[-1] += field_size
+            else:
+                steps.append(field_size)
+    
+    def _collect_accessors(self, msg_info: Dict[str, Any], path: List[str], steps: List[Any]) -> List[Dict[str, Any]]:
+        # One accessor per scalar, string and scalar-array leaf reachable through non-array nested fields
+        accessors = []
+        steps = list(steps)
+        for field in msg_info['fields']:
+            field_path = path + [field['name']]
+            if field['nested_message'] and not field['is_array']:
+                accessors.extend(self._collect_accessors(field['nested_message'], field_path, steps))
+            elif field['is_string'] and not field['is_array'] or field['is_builtin'] and not field['is_string'] and field['size']:
+                offset = steps[0] if steps and isinstance(steps[0], int) else 0
+                accessors.append({
+                    'name': '_'.join(field_path),
+                    'path': '.'.join(field_path),
+                    'field': field,
+                    'offset': offset,
+                    'steps': steps[1:] if offset else list(steps)
+                })
+            self._append_wire_step(steps, field)
+        return accessors
+    
+    def _has_wire_representation(self, field: Dict[str, Any]) -> bool:
+        # Builtins without a known wire size are skipped by the unrolled templates as well
+        return field['is_string'] or not field['is_builtin'] or field['size'] is not None
+    
+    def _collect_messages(self, message_type: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         analyzed_message = self.analyzer.analyze_message_type(message_type)
         dependencies = self.analyzer.get_all_dependencies(message_type)
         
@@ -191,46 +518,92 @@ class DynamicCodeGenerator:
             all_messages[dep] = self.analyzer.analyze_message_type(dep)
         all_messages[message_type] = analyzed_message
         
-        self._generate_dynamic_serializer(analyzed_message, all_messages, output_path)
-        self._generate_dynamic_deserializer(analyzed_message, all_messages, output_path)
+        return analyzed_message, all_messages
+    
+    def _crc_context(self, crc: Optional[str]) -> Dict[str, Any]:
+        return {
+            'crc': bool(crc),
+            'crc_name': get_crc_algorithm(crc)['name'] if crc else None,
+        }
     
-    def _generate_dynamic_serializer(self, message: Dict[str, Any], all_messages: Dict[str, Any], output_path: Path):
-        template_content = self._create_dynamic_serializer_template()
-        template = self.env.from_string(template_content)
+    def _generate_dynamic_serializer(self, message: Dict[str, Any], all_messages: Dict[str, Any], crc: Optional[str] = None, short_names: bool = True) -> str:
+        template = self._get_template('serializer', self._create_dynamic_serializer_template)
+        crc_context = self._crc_context(crc)
         
         content = template.render(
             message=message,
             all_messages=all_messages,
-            analyzer=self.analyzer
+            fragments=self._render_fragments('serializer', get_dynamic_serializer_fragment_template, message, all_messages, crc_context),
+            analyzer=self.analyzer,
+            short_names=short_names,
+            **crc_context
         )
         
-        msg_dir = output_path / message['package'] / message['name']
-        msg_dir.mkdir(parents=True, exist_ok=True)
+        return content
+    
+    def _generate_dynamic_deserializer(self, message: Dict[str, Any], all_messages: Dict[str, Any], crc: Optional[str] = None, short_names: bool = True) -> str:
+        template = self._get_template('deserializer', self._create_dynamic_deserializer_template)
+        crc_context = self._crc_context(crc)
         
-        with open(msg_dir / "serialize.h", "w") as f:
-            f.write(content)
+        content = template.render(
+            message=message,
+            all_messages=all_messages,
+            fragments=self._render_fragments('deserializer', get_dynamic_deserializer_fragment_template, message, all_messages, crc_context,
+                                             type_context=self._min_element_sizes_context),
+            analyzer=self.analyzer,
+            short_names=short_names,
+            **crc_context
+        )
+        
+        return content
     
-    def _generate_dynamic_deserializer(self, message: Dict[str, Any], all_messages: Dict[str, Any], output_path: Path):
-        template_content = self._create_dynamic_deserializer_template()
-        template = self.env.from_string(template_content)
+    def _generate_dynamic_iovec_serializer(self, message: Dict[str, Any], all_messages: Dict[str, Any], short_names: bool = True) -> str:
+        template = self._get_template('iovec_serializer', self._create_dynamic_iovec_serializer_template)
         
         content = template.render(
             message=message,
             all_messages=all_messages,
-            analyzer=self.analyzer
+            fragments=self._render_fragments('iovec_serializer', get_dynamic_iovec_serializer_fragment_template, message, all_messages),
+            analyzer=self.analyzer,
+            short_names=short_names
         )
         
-        msg_dir = output_path / message['package'] / message['name']
-        msg_dir.mkdir(parents=True, exist_ok=True)
+        return content
+    
+    def _render_fragments(self, kind: str, create_template, message: Dict[str, Any], all_messages: Dict[str, Any], context: Optional[Dict[str, Any]] = None, type_context=None) -> Dict[str, str]:
+        # Each type's functions are rendered once per output options and reused by every
+        # header whose closure contains the type; only the name prefix differs between headers
+        context = context or {}
+        template = self._get_template(f'{kind}_fragment', create_template)
+        prefix = message['c_type'].lower()
         
-        with open(msg_dir / "deserialize.h", "w") as f:
-            f.write(content)
+        fragments = {}
+        for msg_type, msg_info in all_messages.items():
+            key = (kind, msg_type, tuple(sorted(context.items())))
+            fragment = self.fragment_cache.get(key)
+            if fragment is None:
+                extra_context = type_context(msg_info) if type_context else {}
+                fragment = template.render(msg_type=msg_type, msg_info=msg_info, prefix=FRAGMENT_PREFIX, **context, **extra_context)
+                self.fragment_cache[key] = fragment
+            fragments[msg_type] = fragment.replace(FRAGMENT_PREFIX, prefix)
+        return fragments
+    
+    def _get_template(self, name: str, create_template):
+        # Compile each template once per generator instance
+        template = self.compiled_templates.get(name)
+        if template is None:
+            template = self.env.from_string(create_template())
+            self.compiled_templates[name] = template
+        return template
     
     def _create_dynamic_serializer_template(self) -> str:
         return get_dynamic_serializer_template()
     
     def _create_dynamic_deserializer_template(self) -> str:
         return get_dynamic_deserializer_template()
+    
+    def _create_dynamic_iovec_serializer_template(self) -> str:
+        return get_dynamic_iovec_serializer_template()
 
 
 def main():
@@ -3,58 +3,70 @@
 import os
 import sys
 import json
-from typing import Dict, Any, List, Set
+from typing import Dict, Any, List, Set, Optional
 from pathlib import Path
 from .dynamic_serializer_generator import DynamicMessageAnalyzer
+from .generated_files import write_generated_files
+from .crc_algorithms import get_crc_algorithm, crc_table
 
 
 class DynamicTypeGenerator:
-    def __init__(self):
-        self.analyzer = DynamicMessageAnalyzer()
+    def __init__(self, analyzer: Optional[DynamicMessageAnalyzer] = None):
+        self.analyzer = analyzer if analyzer is not None else DynamicMessageAnalyzer()
         self.generated_types = set()
         self.type_definitions = []
     
-    def generate_type_definitions(self, message_types: List[str], output_dir: str):
-        output_path = Path(output_dir)
-        common_dir = output_path / 'common'
-        common_dir.mkdir(parents=True, exist_ok=True)
-        
-        all_types = set()
-        for msg_type in message_types:
-            all_types.add(msg_type)
-            dependencies = self.analyzer.get_all_dependencies(msg_type)
-            all_types.update(dependencies)
+    def generate_type_definitions(self, message_types: List[str], output_dir: str, iovec: bool = False, table_codec: bool = False, accessors: bool = False, shm_ring: bool = False, crc: Optional[str] = None):
+        write_generated_files(self.render_type_definitions(message_types, iovec=iovec, table_codec=table_codec, accessors=accessors, shm_ring=shm_ring, crc=crc), output_dir)
+    
+    def render_type_definitions(self, message_types: List[str], iovec: bool = False, table_codec: bool = False, accessors: bool = False, shm_ring: bool = False, crc: Optional[str] = None) -> Dict[str, str]:
+        all_types = self.analyzer.get_dependency_closure(message_types)
         
         sorted_types = self._sort_by_dependencies(all_types)
         
-        self._generate_dynamic_types_header(sorted_types, common_dir)
-        self._generate_serialize_utils(common_dir)
+        files = {
+            'common/dynamic_types.h': self._generate_dynamic_types_header(sorted_types),
+            'common/serialize_utils.h': self._generate_serialize_utils(),
+        }
+        if iovec:
+            files['common/serialize_iovec.h'] = self._generate_serialize_iovec()
+        if table_codec:
+            files['common/table_codec.h'] = self._generate_table_codec()
+            files['common/table_codec.c'] = self._generate_table_codec_source()
+        if accessors:
+            files['common/serialize_access.h'] = self._generate_serialize_access()
+        if shm_ring:
+            files['common/shm_ring.h'] = self._generate_shm_ring()
+        if crc:
+            files['common/serialize_crc.h'] = self._generate_serialize_crc(crc)
+        return files
     
     def _sort_by_dependencies(self, types: Set[str]) -> List[str]:
+        # Iterative depth-first topological sort: dependencies come first
         sorted_types = []
         processed = set()
         
-        def process_type(type_name: str):
-            if type_name in processed:
-                return
-            
-            analyzed = self.analyzer.analyze_message_type(type_name)
-            
-            for field in analyzed['fields']:
-                if field['nested_message']:
-                    nested_type = field['nested_message']['full_name']
-                    if nested_type in types and nested_type not in processed:
-                        process_type(nested_type)
+        for root_type in sorted(types):
+            if root_type in processed:
+                continue
             
-            sorted_types.append(type_name)
-            processed.add(type_name)
-        
-        for type_name in types:
-            process_type(type_name)
+            in_progress = {root_type}
+            stack = [(root_type, iter(self.analyzer.get_nested_types(root_type)))]
+            while stack:
+                type_name, nested_types = stack[-1]
+                for nested_type in nested_types:
+                    if nested_type in types and nested_type not in processed and nested_type not in in_progress:
+                        in_progress.add(nested_type)
+                        stack.append((nested_type, iter(self.analyzer.get_nested_types(nested_type))))
+                        break
+                else:
+                    stack.pop()
+                    sorted_types.append(type_name)
+                    processed.add(type_name)
         
         return sorted_types
     
-    def _generate_dynamic_types_header(self, sorted_types: List[str], output_dir: Path):
+    def _generate_dynamic_types_header(self, sorted_types: List[str]) -> str:
         header_content = '''#ifndef MSG_SERIALIZER_DYNAMIC_TYPES_H_
 #define MSG_SERIALIZER_DYNAMIC_TYPES_H_
 
@@ -65,25 +77,131 @@ class DynamicTypeGenerator:
 '''
         header_content += '\n// Include necessary headers for message types\n'
         for type_name in sorted_types:
-            type_names = type_name.split('/')
-            msg_type_str = f"#include <"
-            if len(type_names) > 1:
-                msg_type_str += '/'.join(type_names[:-1]) + '/'
-                for i in range(len(type_names[-1])):
-                    if type_names[-1][i].isupper() and i != 0:
-                        msg_type_str += '_' + type_names[-1][i].lower()
-                    else:
-                        msg_type_str += type_names[-1][i].lower()
-                msg_type_str += '.h>\n'
-            else:
-                msg_type_str += type_names[0].lower() + '.h>\n'
-            header_content += msg_type_str
+            header_content += f"#include <{self._get_rosidl_header(type_name)}>\n"
         
         
         header_content += '#endif // MSG_SERIALIZER_DYNAMIC_TYPES_H_\n'
         
-        with open(output_dir / 'dynamic_types.h', 'w') as f:
-            f.write(header_content)
+        return header_content
+    
+    def _get_rosidl_header(self, type_name: str) -> str:
+        type_names = type_name.split('/')
+        if len(type_names) == 1:
+            return type_names[0].lower() + '.h'
+        
+        header = '/'.join(type_names[:-1]) + '/'
+        for i in range(len(type_names[-1])):
+            if type_names[-1][i].isupper() and i != 0:
+                header += '_' + type_names[-1][i].lower()
+            else:
+                header += type_names[-1][i].lower()
+        return header + '.h'
+    
+    def generate_message_headers(self, message_types: List[str], output_dir: str, iovec: bool = False, accessors: bool = False, shm_ring: bool = False):
+        write_generated_files(self.render_message_headers(message_types, iovec=iovec, accessors=accessors, shm_ring=shm_ring), output_dir)
+    
+    def render_message_headers(self, message_types: List[str], iovec: bool = False, accessors: bool = False, shm_ring: bool = False) -> Dict[str, str]:
+        # Per-message umbrella headers that pull in only that message's own closure
+        files = {}
+        for msg_type in message_types:
+            analyzed = self.analyzer.analyze_message_type(msg_type)
+            
+            guard = f"MSG_SERIALIZER_{analyzed['c_type'].upper()}_CODEC_H_"
+            header_content = f'''#ifndef {guard}
+#define {guard}
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdbool.h>
+
+#include <{self._get_rosidl_header(analyzed['full_name'])}>
+#include "common/serialize_utils.h"
+'''
+            if iovec:
+                header_content += '#include "common/serialize_iovec.h"\n'
+            if accessors:
+                header_content += '#include "common/serialize_access.h"\n'
+            if shm_ring:
+                header_content += '#include "common/shm_ring.h"\n'
+            header_content += '\n'
+            header_content += f'#include "{analyzed["package"]}/{analyzed["name"]}/serialize.h"\n'
+            header_content += f'#include "{analyzed["package"]}/{analyzed["name"]}/deserialize.h"\n'
+            if iovec:
+                header_content += f'#include "{analyzed["package"]}/{analyzed["name"]}/serialize_iovec.h"\n'
+            if accessors:
+                header_content += f'#include "{analyzed["package"]}/{analyzed["name"]}/access.h"\n'
+            if shm_ring:
+                header_content += f'#include "{analyzed["package"]}/{analyzed["name"]}/shm_ring.h"\n'
+            header_content += f'\n#endif // {guard}\n'
+            
+            files[f"{analyzed['package']}/{analyzed['name']}/codec.h"] = header_content
+        return files
+    
+    def generate_depfile(self, message_types: List[str], output_dir: str, depfile: str, iovec: bool = False, table_driven: Optional[List[str]] = None, accessors: bool = False, shm_ring: bool = False, python_bindings: bool = False, stamp: Optional[str] = None):
+        depfile_path = Path(depfile).resolve()
+        write_generated_files({depfile_path.name: self.render_depfile(message_types, output_dir, iovec=iovec, table_driven=table_driven, accessors=accessors, shm_ring=shm_ring, python_bindings=python_bindings, stamp=stamp)}, str(depfile_path.parent))
+    
+    def render_depfile(self, message_types: List[str], output_dir: str, iovec: bool = False, table_driven: Optional[List[str]] = None, accessors: bool = False, shm_ring: bool = False, python_bindings: bool = False, stamp: Optional[str] = None) -> str:
+        # Makefile/Ninja-style rules: each generated header depends on the
+        # definitions of the messages in its own dependency closure. With stamp,
+        # a single rule makes that file (the build system's output for the
+        # generator run) depend on every definition instead.
+        output_path = Path(output_dir).resolve()
+        per_message_headers = ['serialize.h', 'deserialize.h', 'codec.h']
+        if iovec:
+            per_message_headers.append('serialize_iovec.h')
+        if accessors:
+            per_message_headers.append('access.h')
+        if shm_ring:
+            per_message_headers.append('shm_ring.h')
+        
+        table_driven = {self.analyzer.analyze_message_type(msg_type)['full_name'] for msg_type in table_driven or []}
+        
+        all_definitions = {}
+        rules = []
+        descriptor_rules = {}
+        for msg_type in message_types:
+            analyzed = self.analyzer.analyze_message_type(msg_type)
+            definitions = self._closure_definitions(msg_type)
+            all_definitions.update(definitions)
+            
+            msg_dir = output_path / analyzed['package'] / analyzed['name']
+            for header in per_message_headers:
+                rules.append((str(msg_dir / header), definitions))
+            
+            if analyzed['full_name'] in table_driven:
+                # Table-driven messages also emit a descriptor.h per type in their closure
+                for type_name in [analyzed['full_name']] + self.analyzer.get_all_dependencies(msg_type):
+                    type_info = self.analyzer.analyze_message_type(type_name)
+                    descriptor = str(output_path / type_info['package'] / type_info['name'] / 'descriptor.h')
+                    if descriptor not in descriptor_rules:
+                        descriptor_rules[descriptor] = self._closure_definitions(type_name)
+        
+        rules.extend(descriptor_rules.items())
+        rules.append((str(output_path / 'common' / 'dynamic_types.h'), all_definitions))
+        rules.append((str(output_path / 'dynamic_serializer_integration.h'), all_definitions))
+        if python_bindings:
+            rules.append((str(output_path / 'python' / 'msg_codecs.c'), all_definitions))
+            rules.append((str(output_path / 'python' / 'msg_codecs.py'), all_definitions))
+        if stamp:
+            rules = [(str(Path(stamp).resolve()), all_definitions)]
+        
+        depfile_content = ''
+        for target, dependencies in rules:
+            depfile_content += _escape_depfile_path(target) + ':'
+            for dependency in dependencies:
+                depfile_content += ' \\\n  ' + _escape_depfile_path(dependency)
+            depfile_content += '\n'
+        return depfile_content
+    
+    def _closure_definitions(self, message_type: str) -> Dict[str, bool]:
+        closure = [message_type] + self.analyzer.get_all_dependencies(message_type)
+        definitions = {}
+        for type_name in closure:
+            definition_file = self.analyzer.analyze_message_type(type_name)['definition_file']
+            if definition_file:
+                definitions[definition_file] = True
+        return definitions
     
     def _generate_struct_definition(self, analyzed: Dict[str, Any]) -> str:
         content = f"// {analyzed['full_name']}\n"
@@ -109,20 +227,121 @@ class DynamicTypeGenerator:
         else:
             return f"    {field_type} {field_name};\n"
     
-    def _generate_serialize_utils(self, output_dir: Path):
+    def _generate_serialize_utils(self) -> str:
         utils_content = '''#ifndef MSG_SERIALIZER_UTILS_H_
 #define MSG_SERIALIZER_UTILS_H_
 
 #include <stddef.h>
 #include <stdint.h>
 
+// Define MSG_SERIALIZER_FREESTANDING on targets without libc to use the
+// portable byte-at-a-time helpers only (no <string.h>, no compiler builtins).
+#if !defined(MSG_SERIALIZER_FREESTANDING)
+#include <string.h>
+#define MSG_SERIALIZER_HAS_MEMCPY 1
+#endif
+
+// Host byte order and byte-swap intrinsics; MSG_SERIALIZER_TO_BE* stays undefined
+// when neither is known and the portable shift-based helpers are used instead.
+#if defined(MSG_SERIALIZER_HAS_MEMCPY) && (defined(__GNUC__) || defined(__clang__)) && defined(__BYTE_ORDER__)
+#if defined(__ORDER_LITTLE_ENDIAN__) && __BYTE_ORDER__ == __ORDER_LITTLE_ENDIAN__
+#define MSG_SERIALIZER_TO_BE16(x) __builtin_bswap16(x)
+#define MSG_SERIALIZER_TO_BE32(x) __builtin_bswap32(x)
+#define MSG_SERIALIZER_TO_BE64(x) __builtin_bswap64(x)
+#elif defined(__ORDER_BIG_ENDIAN__) && __BYTE_ORDER__ == __ORDER_BIG_ENDIAN__
+#define MSG_SERIALIZER_TO_BE16(x) (x)
+#define MSG_SERIALIZER_TO_BE32(x) (x)
+#define MSG_SERIALIZER_TO_BE64(x) (x)
+#endif
+#elif defined(MSG_SERIALIZER_HAS_MEMCPY) && defined(_MSC_VER)
+#include <stdlib.h>
+#define MSG_SERIALIZER_TO_BE16(x) _byteswap_ushort(x)
+#define MSG_SERIALIZER_TO_BE32(x) _byteswap_ulong(x)
+#define MSG_SERIALIZER_TO_BE64(x) _byteswap_uint64(x)
+#endif
+
 static inline void virt_memcpy(uint8_t* dest, const uint8_t* src, size_t n)
 {
+#if defined(MSG_SERIALIZER_HAS_MEMCPY)
+    if (n > 0) {
+        memcpy(dest, src, n);
+    }
+#else
     for (size_t i = 0; i < n; ++i) {
         dest[i] = src[i];
     }
+#endif
+}
+
+// Bit-exact copies between scalar fields (float, double, signed) and their
+// unsigned wire representation without type-punned pointer casts
+static inline uint32_t load_u32_bits(const void* src)
+{
+    uint32_t value;
+    virt_memcpy((uint8_t*)&value, (const uint8_t*)src, sizeof(value));
+    return value;
+}
+
+static inline void store_u32_bits(void* dest, uint32_t value)
+{
+    virt_memcpy((uint8_t*)dest, (const uint8_t*)&value, sizeof(value));
+}
+
+static inline uint64_t load_u64_bits(const void* src)
+{
+    uint64_t value;
+    virt_memcpy((uint8_t*)&value, (const uint8_t*)src, sizeof(value));
+    return value;
+}
+
+static inline void store_u64_bits(void* dest, uint64_t value)
+{
+    virt_memcpy((uint8_t*)dest, (const uint8_t*)&value, sizeof(value));
 }
 
+#if defined(MSG_SERIALIZER_TO_BE32)
+
+static inline void serialize_u32_be(uint8_t* buffer, uint32_t value)
+{
+    value = MSG_SERIALIZER_TO_BE32(value);
+    memcpy(buffer, &value, sizeof(value));
+}
+
+static inline uint32_t deserialize_u32_be(const uint8_t* buffer)
+{
+    uint32_t value;
+    memcpy(&value, buffer, sizeof(value));
+    return MSG_SERIALIZER_TO_BE32(value);
+}
+
+static inline void serialize_u16_be(uint8_t* buffer, uint16_t value)
+{
+    value = MSG_SERIALIZER_TO_BE16(value);
+    memcpy(buffer, &value, sizeof(value));
+}
+
+static inline uint16_t deserialize_u16_be(const uint8_t* buffer)
+{
+    uint16_t value;
+    memcpy(&value, buffer, sizeof(value));
+    return MSG_SERIALIZER_TO_BE16(value);
+}
+
+static inline void serialize_u64_be(uint8_t* buffer, uint64_t value)
+{
+    value = MSG_SERIALIZER_TO_BE64(value);
+    memcpy(buffer, &value, sizeof(value));
+}
+
+static inline uint64_t deserialize_u64_be(const uint8_t* buffer)
+{
+    uint64_t value;
+    memcpy(&value, buffer, sizeof(value));
+    return MSG_SERIALIZER_TO_BE64(value);
+}
+
+#else // Portable fallback
+
 static inline void serialize_u32_be(uint8_t* buffer, uint32_t value)
 {
     buffer[0] = (uint8_t)((value >> 24) & 0xFF);
@@ -175,11 +394,769 @@ static inline uint64_t deserialize_u64_be(const uint8_t* buffer)
            ((uint64_t)buffer[7]);
 }
 
+#endif // Portable fallback
+
 #endif // MSG_SERIALIZER_UTILS_H_
 '''
         
-        with open(output_dir / 'serialize_utils.h', 'w') as f:
-            f.write(utils_content)
+        return utils_content
+
+    def _generate_serialize_iovec(self) -> str:
+        iovec_content = '''#ifndef MSG_SERIALIZER_IOVEC_H_
+#define MSG_SERIALIZER_IOVEC_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include <sys/uio.h>
+
+// Byte sequences at least this long are emitted as their own iovec entry
+#ifndef MSG_SERIALIZER_IOVEC_THRESHOLD
+#define MSG_SERIALIZER_IOVEC_THRESHOLD 256
+#endif
+
+typedef struct msg_iovec_writer {
+    uint8_t* scratch;
+    size_t scratch_size;
+    size_t segment_start;
+    struct iovec* iov;
+    size_t iov_max;
+    size_t iov_count;
+} msg_iovec_writer;
+
+static inline void msg_iovec_writer_init(msg_iovec_writer* writer, uint8_t* scratch, size_t scratch_size, struct iovec* iov, size_t iov_max)
+{
+    writer->scratch = scratch;
+    writer->scratch_size = scratch_size;
+    writer->segment_start = 0;
+    writer->iov = iov;
+    writer->iov_max = iov_max;
+    writer->iov_count = 0;
+}
+
+static inline int msg_iovec_push(msg_iovec_writer* writer, const uint8_t* base, size_t len)
+{
+    if (len == 0) {
+        return 1;
+    }
+    if (writer->iov == NULL || writer->iov_count >= writer->iov_max) {
+        return 0;
+    }
+    writer->iov[writer->iov_count].iov_base = (void*)base;
+    writer->iov[writer->iov_count].iov_len = len;
+    writer->iov_count++;
+    return 1;
+}
+
+// Close the pending scratch segment at offset and append a reference to data
+static inline int msg_iovec_reference(msg_iovec_writer* writer, size_t offset, const uint8_t* data, size_t len)
+{
+    if (!msg_iovec_push(writer, writer->scratch + writer->segment_start, offset - writer->segment_start)) {
+        return 0;
+    }
+    writer->segment_start = offset;
+    return msg_iovec_push(writer, data, len);
+}
+
+// Emit the trailing scratch segment and return the total serialized length
+static inline size_t msg_iovec_finish(msg_iovec_writer* writer, size_t offset, size_t* iov_count)
+{
+    if (!msg_iovec_push(writer, writer->scratch + writer->segment_start, offset - writer->segment_start)) {
+        return 0;
+    }
+    writer->segment_start = offset;
+
+    size_t total = 0;
+    for (size_t i = 0; i < writer->iov_count; ++i) {
+        total += writer->iov[i].iov_len;
+    }
+    if (iov_count != NULL) {
+        *iov_count = writer->iov_count;
+    }
+    return total;
+}
+
+#endif // MSG_SERIALIZER_IOVEC_H_
+'''
+
+        return iovec_content
+
+    def _generate_serialize_access(self) -> str:
+        access_content = '''#ifndef MSG_SERIALIZER_ACCESS_H_
+#define MSG_SERIALIZER_ACCESS_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include "common/serialize_utils.h"
+
+// Helpers for the generated accessors (access.h), which read fields in place
+// from a serialized buffer without allocating or copying. Each helper takes
+// the offset of an item and returns the offset just past it, or 0 if the
+// buffer is truncated.
+
+static inline size_t msg_access_read_length(const uint8_t* buffer, size_t buffer_size, size_t offset, uint32_t* length)
+{
+    if (offset > buffer_size || buffer_size - offset < sizeof(uint32_t)) return 0;
+    *length = deserialize_u32_be(buffer + offset);
+    return offset + sizeof(uint32_t);
+}
+
+// Strings: u32 length including the NUL terminator, then the characters
+static inline size_t msg_access_skip_string(const uint8_t* buffer, size_t buffer_size, size_t offset)
+{
+    uint32_t length_with_null;
+    offset = msg_access_read_length(buffer, buffer_size, offset, &length_with_null);
+    if (offset == 0 || length_with_null > buffer_size - offset) return 0;
+    return offset + length_with_null;
+}
+
+// Sequences of fixed-size elements: u32 count, then count * element_size bytes
+static inline size_t msg_access_skip_sequence(const uint8_t* buffer, size_t buffer_size, size_t offset, size_t element_size)
+{
+    uint32_t count;
+    offset = msg_access_read_length(buffer, buffer_size, offset, &count);
+    if (offset == 0) return 0;
+    if (element_size != 0 && count > (buffer_size - offset) / element_size) return 0;
+    return offset + (size_t)count * element_size;
+}
+
+static inline size_t msg_access_string(const uint8_t* buffer, size_t buffer_size, size_t offset, const char** data, size_t* length)
+{
+    uint32_t length_with_null;
+    offset = msg_access_read_length(buffer, buffer_size, offset, &length_with_null);
+    if (offset == 0 || length_with_null == 0 || length_with_null > buffer_size - offset) return 0;
+    *data = (const char*)(buffer + offset);
+    *length = length_with_null - 1;
+    return offset + length_with_null;
+}
+
+static inline size_t msg_access_sequence(const uint8_t* buffer, size_t buffer_size, size_t offset, size_t element_size, const uint8_t** data, size_t* count)
+{
+    uint32_t element_count;
+    size_t end = msg_access_skip_sequence(buffer, buffer_size, offset, element_size);
+    if (end == 0) return 0;
+    element_count = deserialize_u32_be(buffer + offset);
+    *data = buffer + offset + sizeof(uint32_t);
+    *count = element_count;
+    return end;
+}
+
+#endif // MSG_SERIALIZER_ACCESS_H_
+'''
+
+        return access_content
+
+    def _generate_serialize_crc(self, algorithm: str) -> str:
+        # Byte-wise table CRC; the lookup table is computed here so the header has no setup code
+        params = get_crc_algorithm(algorithm)
+        width = params['width']
+        value_type = 'uint32_t' if width == 32 else 'uint16_t'
+        digits = width // 4
+        table = crc_table(algorithm)
+        
+        table_rows = []
+        for row in range(0, 256, 8):
+            table_rows.append('    ' + ', '.join(f"0x{value:0{digits}X}u" for value in table[row:row + 8]))
+        
+        if params['reflected']:
+            update_step = 'value = msg_crc_table[(value ^ byte) & 0xFFu] ^ (value >> 8);'
+        else:
+            update_step = f'value = ({value_type})(msg_crc_table[((value >> {width - 8}) ^ byte) & 0xFFu] ^ (value << 8));'
+        
+        crc_content = f'''#ifndef MSG_SERIALIZER_CRC_H_
+#define MSG_SERIALIZER_CRC_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include "common/serialize_utils.h"
+
+// {params['name']} (polynomial 0x{params['polynomial']:0{digits}X}, init 0x{params['init']:0{digits}X}, xorout 0x{params['xorout']:0{digits}X}, {'reflected' if params['reflected'] else 'not reflected'}).
+// The *_crc serializers fold each field into the checksum right after writing it,
+// while it is still in cache, and checksum byte sequences while copying them. The
+// result is appended big-endian after the payload as a MSG_CRC_TRAILER_SIZE trailer.
+#define MSG_CRC_TRAILER_SIZE {width // 8}
+
+typedef struct msg_crc_state {{
+    {value_type} value;
+    size_t covered; // bytes at the start of the buffer already folded into value
+}} msg_crc_state;
+
+static const {value_type} msg_crc_table[256] = {{
+{(',' + chr(10)).join(table_rows)}
+}};
+
+static inline void msg_crc_init(msg_crc_state* crc)
+{{
+    crc->value = 0x{params['init']:0{digits}X}u;
+    crc->covered = 0;
+}}
+
+static inline void msg_crc_update(msg_crc_state* crc, const uint8_t* data, size_t length)
+{{
+    {value_type} value = crc->value;
+    for (size_t i = 0; i < length; ++i) {{
+        const uint8_t byte = data[i];
+        {update_step}
+    }}
+    crc->value = value;
+    crc->covered += length;
+}}
+
+// Fold buffer[covered, offset) into the checksum
+static inline void msg_crc_advance(msg_crc_state* crc, const uint8_t* buffer, size_t offset)
+{{
+    if (offset > crc->covered) {{
+        msg_crc_update(crc, buffer + crc->covered, offset - crc->covered);
+    }}
+}}
+
+// Copy length bytes and fold them into the checksum in the same loop
+static inline void msg_crc_copy(msg_crc_state* crc, uint8_t* dst, const uint8_t* src, size_t length)
+{{
+    {value_type} value = crc->value;
+    for (size_t i = 0; i < length; ++i) {{
+        const uint8_t byte = src[i];
+        dst[i] = byte;
+        {update_step}
+    }}
+    crc->value = value;
+    crc->covered += length;
+}}
+
+static inline {value_type} msg_crc_finish(const msg_crc_state* crc)
+{{
+    return ({value_type})(crc->value ^ 0x{params['xorout']:0{digits}X}u);
+}}
+
+static inline void msg_crc_write_trailer(uint8_t* buffer, {value_type} crc)
+{{
+    serialize_u{width}_be(buffer, crc);
+}}
+
+static inline {value_type} msg_crc_read_trailer(const uint8_t* buffer)
+{{
+    return deserialize_u{width}_be(buffer);
+}}
+
+#endif // MSG_SERIALIZER_CRC_H_
+'''
+
+        return crc_content
+
+    def _generate_shm_ring(self) -> str:
+        shm_ring_content = '''#ifndef MSG_SERIALIZER_SHM_RING_H_
+#define MSG_SERIALIZER_SHM_RING_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include "common/serialize_utils.h"
+
+// Lock-free single-producer/single-consumer ring of fixed-size slots in
+// shared memory. The producer serializes straight into a reserved slot and
+// commits it; the consumer deserializes or views the slot in place and
+// releases it. Payloads use the regular big-endian wire format; the control
+// fields below are host-endian because both sides run on the same host.
+//
+// Memory layout (keep in sync with module/shm_ring_reader.py):
+//   [0, 64)    magic, version, slot_count, slot_size
+//   [64, 128)  head: number of slots committed by the producer
+//   [128, 192) tail: number of slots released by the consumer
+//   [192, ...) slot_count slots of MSG_SHM_RING_SLOT_HEADER_SIZE + slot_size bytes,
+//              each starting with the uint32_t payload length
+#if !defined(__GNUC__) && !defined(__clang__)
+#error "common/shm_ring.h requires GCC or Clang __atomic builtins"
+#endif
+
+#define MSG_SHM_RING_MAGIC 0x4D534752u // "MSGR"
+#define MSG_SHM_RING_VERSION 1u
+#define MSG_SHM_RING_CACHE_LINE 64
+#define MSG_SHM_RING_SLOT_HEADER_SIZE 8
+
+// Errors returned by the per-message write_/read_<type>_shm_ring helpers, which
+// return the payload length on success and 0 if the ring is full (write) or empty (read)
+#define MSG_SHM_RING_TOO_LARGE (-1)  // message does not fit in a slot; nothing was committed
+#define MSG_SHM_RING_MALFORMED (-2)  // payload failed to decode; its slot was released
+
+typedef struct msg_shm_ring_header {
+    uint32_t magic;
+    uint32_t version;
+    uint32_t slot_count;  // power of two
+    uint32_t slot_size;   // payload capacity of one slot, multiple of 8
+    uint8_t reserved0[MSG_SHM_RING_CACHE_LINE - 4 * sizeof(uint32_t)];
+    uint32_t head;        // written by the producer only
+    uint8_t reserved1[MSG_SHM_RING_CACHE_LINE - sizeof(uint32_t)];
+    uint32_t tail;        // written by the consumer only
+    uint8_t reserved2[MSG_SHM_RING_CACHE_LINE - sizeof(uint32_t)];
+} msg_shm_ring_header;
+
+// Process-local handle; use one per side
+typedef struct msg_shm_ring {
+    msg_shm_ring_header* header;
+    uint8_t* slots;
+    size_t memory_size;
+    uint32_t cached_index; // last seen index of the other side
+} msg_shm_ring;
+
+static inline size_t msg_shm_ring_slot_stride(uint32_t slot_size)
+{
+    return MSG_SHM_RING_SLOT_HEADER_SIZE + (((size_t)slot_size + 7u) & ~(size_t)7u);
+}
+
+// Bytes of shared memory needed for a ring, or 0 if the geometry is invalid
+static inline size_t msg_shm_ring_memory_size(uint32_t slot_count, uint32_t slot_size)
+{
+    size_t stride = msg_shm_ring_slot_stride(slot_size);
+    if (slot_count == 0 || (slot_count & (slot_count - 1)) != 0 || slot_count > 0x80000000u) return 0;
+    if (stride > (SIZE_MAX - sizeof(msg_shm_ring_header)) / slot_count) return 0;
+    return sizeof(msg_shm_ring_header) + (size_t)slot_count * stride;
+}
+
+static inline uint8_t* msg_shm_ring_slot(const msg_shm_ring* ring, uint32_t index)
+{
+    return ring->slots + (size_t)(index & (ring->header->slot_count - 1)) * msg_shm_ring_slot_stride(ring->header->slot_size);
+}
+
+// Format memory as an empty ring (creator side). Returns 1 on success, 0 on failure.
+static inline int msg_shm_ring_init(msg_shm_ring* ring, void* memory, size_t memory_size, uint32_t slot_count, uint32_t slot_size)
+{
+    msg_shm_ring_header* header = (msg_shm_ring_header*)memory;
+    size_t required = msg_shm_ring_memory_size(slot_count, slot_size);
+    if (memory == NULL || required == 0 || memory_size < required) return 0;
+
+    header->slot_count = slot_count;
+    header->slot_size = (uint32_t)(msg_shm_ring_slot_stride(slot_size) - MSG_SHM_RING_SLOT_HEADER_SIZE);
+    header->version = MSG_SHM_RING_VERSION;
+    __atomic_store_n(&header->head, 0u, __ATOMIC_RELAXED);
+    __atomic_store_n(&header->tail, 0u, __ATOMIC_RELAXED);
+    // Publishing the magic last makes a half-initialized ring unattachable
+    __atomic_store_n(&header->magic, MSG_SHM_RING_MAGIC, __ATOMIC_RELEASE);
+
+    ring->header = header;
+    ring->slots = (uint8_t*)memory + sizeof(msg_shm_ring_header);
+    ring->memory_size = memory_size;
+    ring->cached_index = 0;
+    return 1;
+}
+
+// Attach to memory formatted by msg_shm_ring_init(). Returns 1 on success, 0 on failure.
+static inline int msg_shm_ring_attach(msg_shm_ring* ring, void* memory, size_t memory_size)
+{
+    msg_shm_ring_header* header = (msg_shm_ring_header*)memory;
+    if (memory == NULL || memory_size < sizeof(msg_shm_ring_header)) return 0;
+    if (__atomic_load_n(&header->magic, __ATOMIC_ACQUIRE) != MSG_SHM_RING_MAGIC || header->version != MSG_SHM_RING_VERSION) return 0;
+
+    size_t required = msg_shm_ring_memory_size(header->slot_count, header->slot_size);
+    if (required == 0 || memory_size < required) return 0;
+
+    ring->header = header;
+    ring->slots = (uint8_t*)memory + sizeof(msg_shm_ring_header);
+    ring->memory_size = memory_size;
+    ring->cached_index = 0;
+    return 1;
+}
+
+// Producer: next free slot payload and its capacity, or NULL if the ring is full
+static inline uint8_t* msg_shm_ring_reserve(msg_shm_ring* ring, size_t* capacity)
+{
+    msg_shm_ring_header* header = ring->header;
+    uint32_t head = __atomic_load_n(&header->head, __ATOMIC_RELAXED);
+    if (head - ring->cached_index >= header->slot_count) {
+        ring->cached_index = __atomic_load_n(&header->tail, __ATOMIC_ACQUIRE);
+        if (head - ring->cached_index >= header->slot_count) return NULL;
+    }
+    *capacity = header->slot_size;
+    return msg_shm_ring_slot(ring, head) + MSG_SHM_RING_SLOT_HEADER_SIZE;
+}
+
+// Producer: publish the slot returned by msg_shm_ring_reserve() holding length bytes
+static inline void msg_shm_ring_commit(msg_shm_ring* ring, size_t length)
+{
+    msg_shm_ring_header* header = ring->header;
+    uint32_t head = __atomic_load_n(&header->head, __ATOMIC_RELAXED);
+    uint32_t slot_length = (uint32_t)length;
+    virt_memcpy(msg_shm_ring_slot(ring, head), (const uint8_t*)&slot_length, sizeof(slot_length));
+    __atomic_store_n(&header->head, head + 1u, __ATOMIC_RELEASE);
+}
+
+// Consumer: oldest committed payload and its length, or NULL if the ring is empty
+static inline const uint8_t* msg_shm_ring_peek(msg_shm_ring* ring, size_t* length)
+{
+    msg_shm_ring_header* header = ring->header;
+    uint32_t tail = __atomic_load_n(&header->tail, __ATOMIC_RELAXED);
+    if (tail == ring->cached_index) {
+        ring->cached_index = __atomic_load_n(&header->head, __ATOMIC_ACQUIRE);
+        if (tail == ring->cached_index) return NULL;
+    }
+    const uint8_t* slot = msg_shm_ring_slot(ring, tail);
+    uint32_t slot_length;
+    virt_memcpy((uint8_t*)&slot_length, slot, sizeof(slot_length));
+    *length = slot_length <= header->slot_size ? slot_length : header->slot_size;
+    return slot + MSG_SHM_RING_SLOT_HEADER_SIZE;
+}
+
+// Consumer: hand the slot returned by msg_shm_ring_peek() back to the producer
+static inline void msg_shm_ring_release(msg_shm_ring* ring)
+{
+    msg_shm_ring_header* header = ring->header;
+    uint32_t tail = __atomic_load_n(&header->tail, __ATOMIC_RELAXED);
+    __atomic_store_n(&header->tail, tail + 1u, __ATOMIC_RELEASE);
+}
+
+// POSIX shared memory helpers; with -std=c99 define _POSIX_C_SOURCE=200809L
+// (or _DEFAULT_SOURCE) before any include to enable them. Older glibc needs -lrt.
+#if !defined(MSG_SERIALIZER_FREESTANDING) && defined(_POSIX_C_SOURCE) && _POSIX_C_SOURCE >= 200112L
+#include <fcntl.h>
+#include <sys/mman.h>
+#include <sys/stat.h>
+#include <unistd.h>
+
+#define MSG_SHM_RING_HAS_POSIX 1
+
+// Create (or replace) the shared memory object name ("/name") and format it as an empty ring
+static inline int msg_shm_ring_create(msg_shm_ring* ring, const char* name, uint32_t slot_count, uint32_t slot_size)
+{
+    size_t memory_size = msg_shm_ring_memory_size(slot_count, slot_size);
+    if (memory_size == 0) return 0;
+
+    shm_unlink(name);
+    int fd = shm_open(name, O_CREAT | O_EXCL | O_RDWR, 0600);
+    if (fd < 0) return 0;
+    if (ftruncate(fd, (off_t)memory_size) != 0) {
+        close(fd);
+        shm_unlink(name);
+        return 0;
+    }
+    void* memory = mmap(NULL, memory_size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    close(fd);
+    if (memory == MAP_FAILED) {
+        shm_unlink(name);
+        return 0;
+    }
+    return msg_shm_ring_init(ring, memory, memory_size, slot_count, slot_size);
+}
+
+// Map a ring created by msg_shm_ring_create() in another process
+static inline int msg_shm_ring_open(msg_shm_ring* ring, const char* name)
+{
+    struct stat st;
+    int fd = shm_open(name, O_RDWR, 0);
+    if (fd < 0) return 0;
+    if (fstat(fd, &st) != 0 || st.st_size <= 0) {
+        close(fd);
+        return 0;
+    }
+    void* memory = mmap(NULL, (size_t)st.st_size, PROT_READ | PROT_WRITE, MAP_SHARED, fd, 0);
+    close(fd);
+    if (memory == MAP_FAILED) return 0;
+    if (!msg_shm_ring_attach(ring, memory, (size_t)st.st_size)) {
+        munmap(memory, (size_t)st.st_size);
+        return 0;
+    }
+    return 1;
+}
+
+// Unmap the ring; the shared memory object stays until msg_shm_ring_unlink()
+static inline void msg_shm_ring_close(msg_shm_ring* ring)
+{
+    if (ring->header != NULL) {
+        munmap((void*)ring->header, ring->memory_size);
+        ring->header = NULL;
+        ring->slots = NULL;
+    }
+}
+
+static inline int msg_shm_ring_unlink(const char* name)
+{
+    return shm_unlink(name) == 0;
+}
+#endif
+
+#endif // MSG_SERIALIZER_SHM_RING_H_
+'''
+
+        return shm_ring_content
+
+    def _generate_table_codec(self) -> str:
+        # Descriptor types and entry points of the table interpreter (see table_codec_template.py)
+        table_codec_content = '''#ifndef MSG_SERIALIZER_TABLE_CODEC_H_
+#define MSG_SERIALIZER_TABLE_CODEC_H_
+
+#include <stddef.h>
+#include <stdint.h>
+
+// Element kinds and array modes of a table-driven field
+#define MSG_FIELD_KIND_SCALAR 0
+#define MSG_FIELD_KIND_STRING 1
+#define MSG_FIELD_KIND_NESTED 2
+
+#define MSG_FIELD_ARRAY_NONE 0
+#define MSG_FIELD_ARRAY_FIXED 1
+#define MSG_FIELD_ARRAY_SEQUENCE 2
+
+struct msg_type_descriptor;
+
+typedef struct msg_field_descriptor {
+    uint32_t offset;          // offsetof() the field in its message struct
+    uint8_t kind;             // MSG_FIELD_KIND_*
+    uint8_t size;             // wire size of a scalar element (1, 2, 4 or 8)
+    uint8_t array;            // MSG_FIELD_ARRAY_*
+    uint32_t array_size;      // element count of fixed arrays
+    uint32_t element_size;    // sizeof() one element in memory
+    const struct msg_type_descriptor* nested;
+} msg_field_descriptor;
+
+typedef struct msg_type_descriptor {
+    uint32_t struct_size;
+    uint32_t min_wire_size;   // smallest serialized size, bounds sequence counts read from the wire
+    uint32_t field_count;
+    const msg_field_descriptor* fields;
+} msg_type_descriptor;
+
+// Memory layout shared by rosidl_runtime_c__String and all rosidl sequences
+typedef struct msg_table_sequence {
+    void* data;
+    size_t size;
+    size_t capacity;
+} msg_table_sequence;
+
+// Entry points used by the generated table-driven serialize_/deserialize_ functions.
+// Defined once in common/table_codec.c; compile it into one of the program's targets
+// (custom_execute_command(TABLE_DRIVEN ...) builds it as msg_serializer_table_codec).
+size_t msg_table_serialize(const msg_type_descriptor* type, const void* msg, uint8_t* buffer, size_t buffer_size);
+size_t msg_table_deserialize(const msg_type_descriptor* type, const uint8_t* buffer, size_t buffer_size, void* msg);
+
+#endif // MSG_SERIALIZER_TABLE_CODEC_H_
+'''
+
+        return table_codec_content
+
+    def _generate_table_codec_source(self) -> str:
+        # The interpreter itself, compiled once instead of in every translation unit
+        table_codec_source = '''#include <stddef.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include "common/serialize_utils.h"
+#include "common/table_codec.h"
+
+static size_t msg_table_serialize_fields(const msg_type_descriptor* type, const uint8_t* msg, uint8_t* buffer, size_t buffer_size, size_t offset);
+static size_t msg_table_deserialize_fields(const msg_type_descriptor* type, const uint8_t* buffer, size_t buffer_size, size_t offset, uint8_t* msg);
+
+static size_t msg_table_serialize_elements(const msg_field_descriptor* field, const uint8_t* data, size_t count, uint8_t* buffer, size_t buffer_size, size_t offset)
+{
+    if (field->kind == MSG_FIELD_KIND_NESTED) {
+        for (size_t i = 0; i < count; ++i) {
+            offset = msg_table_serialize_fields(field->nested, data + i * field->element_size, buffer, buffer_size, offset);
+            if (offset == 0) return 0;
+        }
+        return offset;
+    }
+
+    if (field->kind == MSG_FIELD_KIND_STRING) {
+        for (size_t i = 0; i < count; ++i) {
+            msg_table_sequence string;
+            virt_memcpy((uint8_t*)&string, data + i * field->element_size, sizeof(string));
+            if (sizeof(uint32_t) > buffer_size - offset || string.size + 1 > buffer_size - offset - sizeof(uint32_t)) return 0;
+
+            serialize_u32_be(buffer + offset, (uint32_t)(string.size + 1));
+            offset += sizeof(uint32_t);
+            virt_memcpy(buffer + offset, (const uint8_t*)string.data, string.size);
+            buffer[offset + string.size] = '\\0';
+            offset += string.size + 1;
+        }
+        return offset;
+    }
+
+    if (count > (buffer_size - offset) / field->size) return 0;
+
+    switch (field->size) {
+    case 1:
+        virt_memcpy(buffer + offset, data, count);
+        offset += count;
+        break;
+    case 2:
+        for (size_t i = 0; i < count; ++i) {
+            uint16_t value;
+            virt_memcpy((uint8_t*)&value, data + i * 2, sizeof(value));
+            serialize_u16_be(buffer + offset, value);
+            offset += 2;
+        }
+        break;
+    case 4:
+        for (size_t i = 0; i < count; ++i) {
+            serialize_u32_be(buffer + offset, load_u32_bits(data + i * 4));
+            offset += 4;
+        }
+        break;
+    case 8:
+        for (size_t i = 0; i < count; ++i) {
+            serialize_u64_be(buffer + offset, load_u64_bits(data + i * 8));
+            offset += 8;
+        }
+        break;
+    default:
+        return 0;
+    }
+    return offset;
+}
+
+static size_t msg_table_serialize_fields(const msg_type_descriptor* type, const uint8_t* msg, uint8_t* buffer, size_t buffer_size, size_t offset)
+{
+    if (msg == NULL || buffer == NULL || offset > buffer_size) {
+        return 0;
+    }
+
+    for (uint32_t f = 0; f < type->field_count; ++f) {
+        const msg_field_descriptor* field = &type->fields[f];
+        const uint8_t* data = msg + field->offset;
+
+        if (field->array == MSG_FIELD_ARRAY_SEQUENCE) {
+            msg_table_sequence sequence;
+            virt_memcpy((uint8_t*)&sequence, data, sizeof(sequence));
+            if (sizeof(uint32_t) > buffer_size - offset) return 0;
+            serialize_u32_be(buffer + offset, (uint32_t)sequence.size);
+            offset += sizeof(uint32_t);
+            offset = msg_table_serialize_elements(field, (const uint8_t*)sequence.data, sequence.size, buffer, buffer_size, offset);
+        } else if (field->array == MSG_FIELD_ARRAY_FIXED) {
+            offset = msg_table_serialize_elements(field, data, field->array_size, buffer, buffer_size, offset);
+        } else {
+            offset = msg_table_serialize_elements(field, data, 1, buffer, buffer_size, offset);
+        }
+        if (offset == 0) return 0;
+    }
+
+    return offset;
+}
+
+static size_t msg_table_min_element_size(const msg_field_descriptor* field)
+{
+    if (field->kind == MSG_FIELD_KIND_NESTED) return field->nested->min_wire_size;
+    if (field->kind == MSG_FIELD_KIND_STRING) return sizeof(uint32_t);
+    return field->size;
+}
+
+static size_t msg_table_deserialize_elements(const msg_field_descriptor* field, const uint8_t* buffer, size_t buffer_size, size_t offset, uint8_t* data, size_t count)
+{
+    if (field->kind == MSG_FIELD_KIND_NESTED) {
+        for (size_t i = 0; i < count; ++i) {
+            offset = msg_table_deserialize_fields(field->nested, buffer, buffer_size, offset, data + i * field->element_size);
+            if (offset == 0) return 0;
+        }
+        return offset;
+    }
+
+    if (field->kind == MSG_FIELD_KIND_STRING) {
+        for (size_t i = 0; i < count; ++i) {
+            if (sizeof(uint32_t) > buffer_size - offset) return 0;
+            uint32_t len_with_null = deserialize_u32_be(buffer + offset);
+            offset += sizeof(uint32_t);
+            if (len_with_null == 0 || len_with_null > buffer_size - offset) return 0;
+
+            msg_table_sequence string;
+            string.data = malloc(len_with_null);
+            if (string.data == NULL) {
+                return 0; // Memory allocation failed
+            }
+            virt_memcpy((uint8_t*)string.data, buffer + offset, len_with_null);
+            string.size = len_with_null - 1;
+            string.capacity = len_with_null;
+            virt_memcpy(data + i * field->element_size, (const uint8_t*)&string, sizeof(string));
+            offset += len_with_null;
+        }
+        return offset;
+    }
+
+    if (count > (buffer_size - offset) / field->size) return 0;
+
+    switch (field->size) {
+    case 1:
+        virt_memcpy(data, buffer + offset, count);
+        offset += count;
+        break;
+    case 2:
+        for (size_t i = 0; i < count; ++i) {
+            uint16_t value = deserialize_u16_be(buffer + offset);
+            virt_memcpy(data + i * 2, (const uint8_t*)&value, sizeof(value));
+            offset += 2;
+        }
+        break;
+    case 4:
+        for (size_t i = 0; i < count; ++i) {
+            store_u32_bits(data + i * 4, deserialize_u32_be(buffer + offset));
+            offset += 4;
+        }
+        break;
+    case 8:
+        for (size_t i = 0; i < count; ++i) {
+            store_u64_bits(data + i * 8, deserialize_u64_be(buffer + offset));
+            offset += 8;
+        }
+        break;
+    default:
+        return 0;
+    }
+    return offset;
+}
+
+static size_t msg_table_deserialize_fields(const msg_type_descriptor* type, const uint8_t* buffer, size_t buffer_size, size_t offset, uint8_t* msg)
+{
+    if (msg == NULL || buffer == NULL || offset > buffer_size) {
+        return 0;
+    }
+
+    for (uint32_t f = 0; f < type->field_count; ++f) {
+        const msg_field_descriptor* field = &type->fields[f];
+        uint8_t* data = msg + field->offset;
+
+        if (field->array == MSG_FIELD_ARRAY_SEQUENCE) {
+            if (sizeof(uint32_t) > buffer_size - offset) return 0;
+            uint32_t count = deserialize_u32_be(buffer + offset);
+            offset += sizeof(uint32_t);
+
+            // Reject counts the remaining buffer cannot hold before allocating for them
+            size_t min_element_size = msg_table_min_element_size(field);
+            if (min_element_size > 0 && count > (buffer_size - offset) / min_element_size) return 0;
+
+            msg_table_sequence sequence;
+            sequence.data = NULL;
+            sequence.size = count;
+            sequence.capacity = count;
+            if (count > 0) {
+                if (count > SIZE_MAX / field->element_size) return 0;
+                // Zero elements that can hold pointers, so a truncated buffer leaves none dangling
+                sequence.data = field->kind == MSG_FIELD_KIND_SCALAR ? malloc(count * field->element_size) : calloc(count, field->element_size);
+                if (sequence.data == NULL) {
+                    return 0; // Memory allocation failed
+                }
+            }
+            virt_memcpy(data, (const uint8_t*)&sequence, sizeof(sequence));
+            offset = msg_table_deserialize_elements(field, buffer, buffer_size, offset, (uint8_t*)sequence.data, count);
+        } else if (field->array == MSG_FIELD_ARRAY_FIXED) {
+            offset = msg_table_deserialize_elements(field, buffer, buffer_size, offset, data, field->array_size);
+        } else {
+            offset = msg_table_deserialize_elements(field, buffer, buffer_size, offset, data, 1);
+        }
+        if (offset == 0) return 0;
+    }
+
+    return offset;
+}
+
+// Entry points declared in common/table_codec.h
+size_t msg_table_serialize(const msg_type_descriptor* type, const void* msg, uint8_t* buffer, size_t buffer_size)
+{
+    return msg_table_serialize_fields(type, (const uint8_t*)msg, buffer, buffer_size, 0);
+}
+
+size_t msg_table_deserialize(const msg_type_descriptor* type, const uint8_t* buffer, size_t buffer_size, void* msg)
+{
+    return msg_table_deserialize_fields(type, buffer, buffer_size, 0, (uint8_t*)msg);
+}
+'''
+
+        return table_codec_source
+
+
+def _escape_depfile_path(path: str) -> str:
+    return path.replace('\\', '/').replace(' ', '\\ ').replace('#', '\\#').replace('$', '$$')
 
 
 def main():
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+
+import os
+import secrets
+from pathlib import Path
+from typing import Dict, List
+
+
+def write_generated_files(files: Dict[str, str], output_dir: str) -> List[str]:
+    """Commit in-memory generated files to output_dir in one pass.
+
+    Keys of files are paths relative to output_dir (absolute paths are used
+    as-is). Files whose content is unchanged are left untouched so their
+    timestamps do not trigger rebuilds. Changed files are first staged as
+    temporary files next to their destination and then renamed into place,
+    so a failure never leaves half-written outputs behind.
+
+    Returns the paths that were (re)written.
+    """
+    output_path = Path(output_dir)
+    pending = []
+    for relative_path, content in files.items():
+        path = output_path / relative_path
+        data = content.encode('utf-8')
+        try:
+            with open(path, 'rb') as f:
+                if f.read() == data:
+                    continue
+        except OSError:
+            pass
+        pending.append((path, data))
+
+    created_dirs = set()
+    staged = []
+    try:
+        for path, data in pending:
+            if path.parent not in created_dirs:
+                path.parent.mkdir(parents=True, exist_ok=True)
+                created_dirs.add(path.parent)
+
+            fd, temp_path = _create_temp_file(path)
+            staged.append((temp_path, path))
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+
+        for temp_path, path in staged:
+            os.replace(temp_path, path)
+    except BaseException:
+        for temp_path, _ in staged:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+        raise
+
+    return [str(path) for path, _ in pending]
+
+
+def _create_temp_file(path: Path):
+    # Like tempfile.mkstemp, but with the permissions a plain open() would
+    # give: the kernel applies the umask to 0666, so it is never toggled
+    flags = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+    while True:
+        temp_path = str(path.parent / f".{path.name}.{secrets.token_hex(4)}.tmp")
+        try:
+            return os.open(temp_path, flags, 0o666), temp_path
+        except FileExistsError:
+            continue
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import json
+import socket
+import tempfile
+from typing import Dict, Any, Optional
+
+
+SOCKET_ENV_VAR = 'ROSMSG_TO_SERIALIZER_SOCKET'
+# Set to 1 to delegate generation to a running server (same as --use-server)
+USE_SERVER_ENV_VAR = 'ROSMSG_TO_SERIALIZER_USE_SERVER'
+# Generation falls back to in-process when the server does not answer in time
+DEFAULT_TIMEOUT = 120.0
+
+# Variables that decide which message packages a generator imports; a server
+# only serves clients whose values match its own
+ENVIRONMENT_VARS = ('PYTHONPATH', 'AMENT_PREFIX_PATH', 'CMAKE_PREFIX_PATH', 'ROS_DISTRO')
+
+
+def server_requested() -> bool:
+    return os.environ.get(USE_SERVER_ENV_VAR, '').lower() in ('1', 'true', 'yes', 'on')
+
+
+def generation_environment() -> Dict[str, Optional[str]]:
+    environment = {name: os.environ.get(name) for name in ENVIRONMENT_VARS}
+    environment['python'] = sys.executable
+    return environment
+
+
+def default_socket_path() -> str:
+    env_path = os.environ.get(SOCKET_ENV_VAR)
+    if env_path:
+        return env_path
+
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir and os.path.isdir(runtime_dir):
+        return os.path.join(runtime_dir, 'rosmsg_to_serializer.sock')
+
+    uid = os.getuid() if hasattr(os, 'getuid') else 0
+    return os.path.join(tempfile.gettempdir(), f'rosmsg_to_serializer-{uid}.sock')
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]):
+    sock.sendall(json.dumps(message).encode('utf-8') + b'\n')
+
+
+def receive_message(sock_file) -> Optional[Dict[str, Any]]:
+    line = sock_file.readline()
+    if not line:
+        return None
+    return json.loads(line.decode('utf-8'))
+
+
+def request_generation(request: Dict[str, Any], socket_path: Optional[str] = None, timeout: Optional[float] = DEFAULT_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """Send a generation request to a running generator server.
+
+    Returns the server response, or None when no server is listening on
+    socket_path, it does not answer within timeout seconds, or it was started
+    with a different environment, so that the caller can fall back to
+    in-process generation.
+    """
+    if not hasattr(socket, 'AF_UNIX'):
+        return None
+
+    path = socket_path or default_socket_path()
+    if not os.path.exists(path):
+        return None
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        send_message(sock, dict(request, environment=generation_environment()))
+        with sock.makefile('rb') as sock_file:
+            response = receive_message(sock_file)
+    except (OSError, ValueError):
+        return None
+    finally:
+        sock.close()
+
+    if response is None or response.get('fallback'):
+        return None
+    return response
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+
+import io
+import os
+import sys
+import importlib
+import signal
+import socket
+import socketserver
+import contextlib
+from pathlib import Path
+from typing import Dict, Any, Optional
+
+from .dynamic_serializer_generator import DynamicCodeGenerator, DynamicMessageAnalyzer
+from .generator_client import default_socket_path, generation_environment, send_message, receive_message
+
+
+class _GeneratorRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = receive_message(self.rfile)
+        except ValueError as e:
+            send_message(self.connection, {'status': 1, 'output': f"Error: invalid request: {e}\n"})
+            return
+        if request is None:
+            return
+
+        response = self.server.generator_server.handle_request(request)
+        send_message(self.connection, response)
+
+
+class _UnixGeneratorServer(socketserver.UnixStreamServer):
+    # Requests are served one at a time: the analyzer and generators are not thread-safe
+    def __init__(self, socket_path: str, generator_server: 'GeneratorServer'):
+        self.generator_server = generator_server
+        super().__init__(socket_path, _GeneratorRequestHandler)
+
+
+class GeneratorServer:
+    """Long-running generator that keeps message analysis and compiled templates warm.
+
+    Only clients started with the same environment (PYTHONPATH, ament/CMake
+    prefix paths, interpreter) are served; others fall back to in-process
+    generation. When a message definition file changes, the cached analysis,
+    rendered fragments and imported message modules are dropped.
+    """
+
+    def __init__(self, socket_path: Optional[str] = None):
+        self.socket_path = socket_path or default_socket_path()
+        self.environment = generation_environment()
+        self.definition_mtimes = {}
+        self._reset_generators()
+
+    def _reset_generators(self):
+        self.analyzer = DynamicMessageAnalyzer()
+        template_dir = Path(__file__).parent.parent / 'templates'
+        self.serializer_generator = DynamicCodeGenerator(str(template_dir), analyzer=self.analyzer)
+
+    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        from ..rosmsg_to_serializer import generate
+
+        command = request.get('command', 'generate')
+        if command == 'ping':
+            return {'status': 0, 'output': ''}
+        if command != 'generate':
+            return {'status': 1, 'output': f"Error: unknown command: {command}\n"}
+        if request.get('environment') != self.environment:
+            return {'status': 1, 'fallback': True, 'output': "Generator server environment differs from the client's\n"}
+
+        self._invalidate_stale_definitions()
+
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            try:
+                status = generate(
+                    request['messages'],
+                    Path(request['output_dir']),
+                    iovec=request.get('iovec', False),
+                    accessors=request.get('accessors', False),
+                    shm_ring=request.get('shm_ring', False),
+                    crc=request.get('crc'),
+                    python_bindings=request.get('python_bindings', False),
+                    depfile=request.get('depfile'),
+                    stamp=request.get('stamp'),
+                    packages=request.get('packages'),
+                    table_driven=request.get('table_driven'),
+                    analyzer=self.analyzer,
+                    serializer_generator=self.serializer_generator,
+                )
+            except Exception as e:
+                print(f"Error: {e}")
+                status = 1
+
+        self._record_definitions()
+        return {'status': status, 'output': output.getvalue()}
+
+    def _record_definitions(self):
+        for analyzed in self.analyzer.analyzed_types.values():
+            definition_file = analyzed['definition_file']
+            if definition_file and definition_file not in self.definition_mtimes:
+                self.definition_mtimes[definition_file] = (analyzed['package'], _mtime(definition_file))
+
+    def _invalidate_stale_definitions(self):
+        # Rebuilt message packages: forget everything derived from their old definitions
+        stale_packages = {package for definition_file, (package, mtime) in self.definition_mtimes.items()
+                          if _mtime(definition_file) != mtime}
+        if not stale_packages:
+            return
+
+        for module_name in list(sys.modules):
+            if module_name.split('.', 1)[0] in stale_packages:
+                del sys.modules[module_name]
+        importlib.invalidate_caches()
+        self.definition_mtimes = {}
+        self._reset_generators()
+
+    def serve_forever(self):
+        if not hasattr(socket, 'AF_UNIX'):
+            raise RuntimeError("Unix domain sockets are not supported on this platform")
+
+        self._remove_stale_socket()
+        server = _UnixGeneratorServer(self.socket_path, self)
+        signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+        print(f"rosmsg_to_serializer server listening on {self.socket_path}", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+            if os.path.exists(self.socket_path):
+                os.unlink(self.socket_path)
+
+    def _remove_stale_socket(self):
+        if not os.path.exists(self.socket_path):
+            return
+
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+        else:
+            raise RuntimeError(f"A generator server is already running on {self.socket_path}")
+        finally:
+            probe.close()
+
+
+def _mtime(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Run a warm rosmsg_to_serializer generator server')
+    parser.add_argument('--socket', help='Unix socket path (default: $ROSMSG_TO_SERIALIZER_SOCKET or a per-user runtime path)')
+
+    args = parser.parse_args()
+
+    try:
+        GeneratorServer(args.socket).serve_forever()
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+
+def get_dynamic_iovec_serializer_template() -> str:
+    return '''#ifndef SERIALIZE_IOVEC_{{ message.c_type.upper() }}_H_
+#define SERIALIZE_IOVEC_{{ message.c_type.upper() }}_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include "common/serialize_utils.h"
+#include "common/serialize_iovec.h"
+
+{%- for msg_type, msg_info in all_messages.items() %}
+// Forward declaration for iovec serializer of {{ msg_type }}
+static size_t serialize_iovec_{{ message.c_type.lower() }}_{{ msg_info.c_type.lower() }}_fields(const {{ msg_info.c_type }}* msg, msg_iovec_writer* writer, size_t offset);
+{%- endfor %}
+
+{%- for msg_type in all_messages %}
+{{- fragments[msg_type] }}
+{%- endfor %}
+
+// Main iovec serializer function
+// Scalars and small fields are written into scratch; byte sequences of at least
+// MSG_SERIALIZER_IOVEC_THRESHOLD bytes are referenced in place. On success iov[0..*iov_count)
+// describes the serialized message (suitable for writev/sendmsg) and the total length is returned.
+// The iovec entries stay valid only as long as msg and scratch are not modified.
+static inline size_t serialize_{{ message.c_type.lower() }}_iovec(const {{ message.c_type }}* msg, uint8_t* scratch, size_t scratch_size, struct iovec* iov, size_t iov_max, size_t* iov_count)
+{
+    msg_iovec_writer writer;
+    msg_iovec_writer_init(&writer, scratch, scratch_size, iov, iov_max);
+
+    size_t offset = serialize_iovec_{{ message.c_type.lower() }}_{{ message.c_type.lower() }}_fields(msg, &writer, 0);
+    if (offset == 0) {
+        return 0;
+    }
+
+    return msg_iovec_finish(&writer, offset, iov_count);
+}
+
+{%- if short_names %}
+
+// Short-name alias, kept while no other generated message is named {{ message.name }}
+static inline size_t serialize_{{ message.name.lower() }}_iovec(const {{ message.c_type }}* msg, uint8_t* scratch, size_t scratch_size, struct iovec* iov, size_t iov_max, size_t* iov_count)
+{
+    return serialize_{{ message.c_type.lower() }}_iovec(msg, scratch, scratch_size, iov, iov_max, iov_count);
+}
+{%- endif %}
+
+#endif // SERIALIZE_IOVEC_{{ message.c_type.upper() }}_H_
+'''
+
+
+def get_dynamic_iovec_serializer_fragment_template() -> str:
+    # Functions for one type in the closure; rendered once per type and shared by every header
+    return '''{%- macro serialize_field_iovec(field, var_name, buffer_name, offset_name) %}
+{%- if field.is_string %}
+    // String field: {{ field.name }}
+    const uint32_t {{ field.name }}_len = {{ var_name }}->{{ field.name }}.size;
+    const uint32_t {{ field.name }}_len_with_null = {{ field.name }}_len + 1;
+
+    if ({{ offset_name }} + sizeof(uint32_t) + {{ field.name }}_len_with_null > buffer_size) {
+        return 0;
+    }
+
+    serialize_u32_be({{ buffer_name }} + {{ offset_name }}, {{ field.name }}_len_with_null);
+    {{ offset_name }} += sizeof(uint32_t);
+
+    virt_memcpy({{ buffer_name }} + {{ offset_name }}, (const uint8_t*){{ var_name }}->{{ field.name }}.data, {{ field.name }}_len);
+    {{ buffer_name }}[{{ offset_name }} + {{ field.name }}_len] = '\\0';
+    {{ offset_name }} += {{ field.name }}_len_with_null;
+{%- elif field.is_dynamic_array and field.is_builtin and field.size == 1 %}
+    // Byte sequence field: {{ field.name }}
+    const uint32_t {{ field.name }}_size = {{ var_name }}->{{ field.name }}.size;
+
+    if ({{ offset_name }} + sizeof(uint32_t) > buffer_size) {
+        return 0;
+    }
+
+    serialize_u32_be({{ buffer_name }} + {{ offset_name }}, {{ field.name }}_size);
+    {{ offset_name }} += sizeof(uint32_t);
+
+    if ({{ field.name }}_size >= MSG_SERIALIZER_IOVEC_THRESHOLD) {
+        // Large payload: referenced in place instead of copied into scratch
+        if (!msg_iovec_reference(writer, {{ offset_name }}, (const uint8_t*){{ var_name }}->{{ field.name }}.data, {{ field.name }}_size)) return 0;
+    } else {
+        if ({{ offset_name }} + {{ field.name }}_size > buffer_size) return 0;
+        virt_memcpy({{ buffer_name }} + {{ offset_name }}, (const uint8_t*){{ var_name }}->{{ field.name }}.data, {{ field.name }}_size);
+        {{ offset_name }} += {{ field.name }}_size;
+    }
+{%- elif field.is_dynamic_array %}
+    // Dynamic array field: {{ field.name }}
+    const uint32_t {{ field.name }}_size = {{ var_name }}->{{ field.name }}.size;
+
+    if ({{ offset_name }} + sizeof(uint32_t) > buffer_size) {
+        return 0;
+    }
+
+    serialize_u32_be({{ buffer_name }} + {{ offset_name }}, {{ field.name }}_size);
+    {{ offset_name }} += sizeof(uint32_t);
+
+    for (uint32_t i = 0; i < {{ field.name }}_size; ++i) {
+        {%- if field.is_builtin %}
+        {%- if field.size == 2 %}
+        if ({{ offset_name }} + 2 > buffer_size) return 0;
+        serialize_u16_be({{ buffer_name }} + {{ offset_name }}, {{ var_name }}->{{ field.name }}.data[i]);
+        {{ offset_name }} += 2;
+        {%- elif field.size == 4 %}
+        if ({{ offset_name }} + 4 > buffer_size) return 0;
+        serialize_u32_be({{ buffer_name }} + {{ offset_name }}, load_u32_bits(&{{ var_name }}->{{ field.name }}.data[i]));
+        {{ offset_name }} += 4;
+        {%- elif field.size == 8 %}
+        if ({{ offset_name }} + 8 > buffer_size) return 0;
+        serialize_u64_be({{ buffer_name }} + {{ offset_name }}, load_u64_bits(&{{ var_name }}->{{ field.name }}.data[i]));
+        {{ offset_name }} += 8;
+        {%- endif %}
+        {%- else %}
+        // Nested message in array: {{ field.nested_message.name }}
+        size_t {{ field.name }}_nested_result = serialize_iovec_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields(&{{ var_name }}->{{ field.name }}.data[i], writer, {{ offset_name }});
+        if ({{ field.name }}_nested_result == 0) return 0;
+        {{ offset_name }} = {{ field.name }}_nested_result;
+        {%- endif %}
+    }
+{%- elif field.is_array %}
+    // Fixed array field: {{ field.name }}
+    {%- if field.is_builtin %}
+    {%- if field.size == 1 %}
+    if ({{ offset_name }} + {{ field.array_size }} > buffer_size) return 0;
+    for (int i = 0; i < {{ field.array_size }}; ++i) {
+        {{ buffer_name }}[{{ offset_name }}] = {{ var_name }}->{{ field.name }}[i];
+        {{ offset_name }} += 1;
+    }
+    {%- elif field.size == 2 %}
+    if ({{ offset_name }} + {{ field.array_size * 2 }} > buffer_size) return 0;
+    for (int i = 0; i < {{ field.array_size }}; ++i) {
+        serialize_u16_be({{ buffer_name }} + {{ offset_name }}, {{ var_name }}->{{ field.name }}[i]);
+        {{ offset_name }} += 2;
+    }
+    {%- elif field.size == 4 %}
+    if ({{ offset_name }} + {{ field.array_size * 4 }} > buffer_size) return 0;
+    for (int i = 0; i < {{ field.array_size }}; ++i) {
+        serialize_u32_be({{ buffer_name }} + {{ offset_name }}, load_u32_bits(&{{ var_name }}->{{ field.name }}[i]));
+        {{ offset_name }} += 4;
+    }
+    {%- elif field.size == 8 %}
+    if ({{ offset_name }} + {{ field.array_size * 8 }} > buffer_size) return 0;
+    for (int i = 0; i < {{ field.array_size }}; ++i) {
+        serialize_u64_be({{ buffer_name }} + {{ offset_name }}, load_u64_bits(&{{ var_name }}->{{ field.name }}[i]));
+        {{ offset_name }} += 8;
+    }
+    {%- endif %}
+    {%- else %}
+    // Nested message array: {{ field.nested_message.name }}
+    for (int i = 0; i < {{ field.array_size }}; ++i) {
+        size_t {{ field.name }}_nested_result = serialize_iovec_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields(&{{ var_name }}->{{ field.name }}[i], writer, {{ offset_name }});
+        if ({{ field.name }}_nested_result == 0) return 0;
+        {{ offset_name }} = {{ field.name }}_nested_result;
+    }
+    {%- endif %}
+{%- else %}
+    // Scalar field: {{ field.name }}
+    {%- if field.is_builtin %}
+    {%- if field.size == 1 %}
+    if ({{ offset_name }} + 1 > buffer_size) return 0;
+    {{ buffer_name }}[{{ offset_name }}] = {{ var_name }}->{{ field.name }};
+    {{ offset_name }} += 1;
+    {%- elif field.size == 2 %}
+    if ({{ offset_name }} + 2 > buffer_size) return 0;
+    serialize_u16_be({{ buffer_name }} + {{ offset_name }}, {{ var_name }}->{{ field.name }});
+    {{ offset_name }} += 2;
+    {%- elif field.size == 4 %}
+    if ({{ offset_name }} + 4 > buffer_size) return 0;
+    serialize_u32_be({{ buffer_name }} + {{ offset_name }}, load_u32_bits(&{{ var_name }}->{{ field.name }}));
+    {{ offset_name }} += 4;
+    {%- elif field.size == 8 %}
+    if ({{ offset_name }} + 8 > buffer_size) return 0;
+    serialize_u64_be({{ buffer_name }} + {{ offset_name }}, load_u64_bits(&{{ var_name }}->{{ field.name }}));
+    {{ offset_name }} += 8;
+    {%- endif %}
+    {%- else %}
+    // Nested message: {{ field.nested_message.name }}
+    size_t {{ field.name }}_nested_result = serialize_iovec_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields(&{{ var_name }}->{{ field.name }}, writer, {{ offset_name }});
+    if ({{ field.name }}_nested_result == 0) return 0;
+    {{ offset_name }} = {{ field.name }}_nested_result;
+    {%- endif %}
+{%- endif %}
+{%- endmacro %}
+// Iovec serializer for {{ msg_type }}
+// offset is the number of scratch bytes used so far
+static size_t serialize_iovec_{{ prefix }}_{{ msg_info.c_type.lower() }}_fields(const {{ msg_info.c_type }}* msg, msg_iovec_writer* writer, size_t offset)
+{
+    if (msg == NULL || writer == NULL || writer->scratch == NULL) {
+        return 0;
+    }
+    uint8_t* buffer = writer->scratch;
+    const size_t buffer_size = writer->scratch_size;
+    (void)buffer;
+    (void)buffer_size;
+
+{%- for field in msg_info.fields %}
+    {{ serialize_field_iovec(field, "msg", "buffer", "offset") }}
+{%- endfor %}
+
+    return offset;
+}
+'''
@@ -0,0 +1,449 @@
+#!/usr/bin/env python3
+
+def get_python_bindings_library_template() -> str:
+    return '''// Shared library behind the Python bindings in msg_codecs.py
+// Build: custom_execute_command(PYTHON_BINDINGS ...), or by hand from this directory:
+//   cc -O2 -std=c99 -fPIC -shared -I.. <message include dirs> -o lib{{ library_name }}.so msg_codecs.c
+// adding ../common/table_codec.c if any message is TABLE_DRIVEN
+
+#include <stdlib.h>
+#include "dynamic_serializer_integration.h"
+
+// Memory returned by the deserializers must be freed by the C runtime that allocated it
+void msg_codecs_free(void* pointer)
+{
+    free(pointer);
+}
+{%- for message in messages %}
+
+// Lets msg_codecs.py check its ctypes layout of {{ message.full_name }}
+size_t msg_codecs_sizeof_{{ message.c_type.lower() }}(void)
+{
+    return sizeof({{ message.c_type }});
+}
+
+// The codecs are static inline in their headers; these give ctypes symbols to load
+size_t msg_codecs_serialize_{{ message.c_type.lower() }}(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
+{
+    return serialize_{{ message.c_type.lower() }}_big_endian(msg, buffer, buffer_size);
+}
+
+size_t msg_codecs_deserialize_{{ message.c_type.lower() }}(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    return deserialize_{{ message.c_type.lower() }}_big_endian(buffer, buffer_size, msg, max_string_buffer_size);
+}
+{%- endfor %}
+'''
+
+
+def get_python_bindings_module_template() -> str:
+    return '''#!/usr/bin/env python3
+"""ctypes bindings for the codecs generated by rosmsg_to_serializer.
+
+Load the shared library built from msg_codecs.c (lib{{ library_name }} next
+to this file, or the path in ${{ library_env_var }}) and call
+serialize()/deserialize() with a message type such as "{{ example_type }}".
+
+Messages are plain dicts keyed by field name; missing fields serialize as
+zero/empty. serialize() passes bytes, bytearray, memoryview and NumPy arrays
+to C in place (buffers are taken as native-endian element data).
+deserialize() returns numeric sequences and fixed arrays as NumPy arrays
+(memoryviews without NumPy) that view the decoded memory without copying;
+that memory is freed once the last view is gone.
+"""
+
+import os
+import ctypes
+from typing import Any, Dict, List, Optional
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+LIBRARY_NAME = '{{ library_name }}'
+LIBRARY_ENV_VAR = '{{ library_env_var }}'
+
+# Analyzer field data for every type reachable from the generated messages,
+# dependencies first. Types with 'codec' have serialize/deserialize entry points.
+MESSAGE_TYPES = {{ message_types }}
+
+_SCALAR_TYPES = {
+    'bool': (ctypes.c_bool, '?'),
+    'char': (ctypes.c_byte, 'b'),
+    'int8_t': (ctypes.c_int8, 'b'),
+    'uint8_t': (ctypes.c_uint8, 'B'),
+    'int16_t': (ctypes.c_int16, 'h'),
+    'uint16_t': (ctypes.c_uint16, 'H'),
+    'int32_t': (ctypes.c_int32, 'i'),
+    'uint32_t': (ctypes.c_uint32, 'I'),
+    'int64_t': (ctypes.c_int64, 'q'),
+    'uint64_t': (ctypes.c_uint64, 'Q'),
+    'float': (ctypes.c_float, 'f'),
+    'double': (ctypes.c_double, 'd'),
+}
+
+_sequence_types = {}
+
+
+def _sequence_type(element_type):
+    # Layout shared by rosidl_runtime_c__String and every rosidl sequence
+    if element_type not in _sequence_types:
+        _sequence_types[element_type] = type(f'{element_type.__name__}__Sequence', (ctypes.Structure,), {
+            '_fields_': [
+                ('data', ctypes.POINTER(element_type)),
+                ('size', ctypes.c_size_t),
+                ('capacity', ctypes.c_size_t),
+            ],
+        })
+    return _sequence_types[element_type]
+
+
+STRING_TYPE = _sequence_type(ctypes.c_char)
+STRUCT_TYPES = {}
+
+
+def _element_type(field: Dict[str, Any]):
+    if field['kind'] == 'nested':
+        return STRUCT_TYPES[field['nested']]
+    if field['kind'] == 'string':
+        return STRING_TYPE
+    if field['kind'] == 'wstring':
+        return _sequence_type(ctypes.c_uint16)
+    return _SCALAR_TYPES[field['c_type']][0]
+
+
+def _build_struct_types():
+    for full_name, info in MESSAGE_TYPES.items():
+        fields = []
+        for field in info['fields']:
+            field_type = _element_type(field)
+            if field['array'] == 'sequence':
+                field_type = _sequence_type(field_type)
+            elif field['array'] == 'fixed':
+                field_type = field_type * field['array_size']
+            fields.append((field['name'], field_type))
+        STRUCT_TYPES[full_name] = type(info['c_type'], (ctypes.Structure,), {'_fields_': fields})
+
+
+_build_struct_types()
+
+
+def _buffer_address(value, keepalive: List[Any]):
+    # Address and length of a bytes-like object without copying it
+    if isinstance(value, bytes):
+        keepalive.append(value)
+        return ctypes.cast(ctypes.c_char_p(value), ctypes.c_void_p).value or 0, len(value)
+    view = memoryview(value)
+    if view.readonly or not view.c_contiguous:
+        return _buffer_address(view.tobytes(), keepalive)
+    array = (ctypes.c_char * view.nbytes).from_buffer(view)
+    keepalive.append(array)
+    return ctypes.addressof(array), view.nbytes
+
+
+def _fill_string(target, value, field: Dict[str, Any], keepalive: List[Any]) -> int:
+    if field['kind'] == 'wstring':
+        raise ValueError(f"wstring field '{field['name']}' is not supported by the Python bindings")
+    data = b'' if value is None else value.encode('utf-8') if isinstance(value, str) else bytes(value)
+    keepalive.append(data)
+    target.data = ctypes.cast(ctypes.c_char_p(data), ctypes.POINTER(ctypes.c_char))
+    target.size = len(data)
+    target.capacity = len(data) + 1
+    return 4 + len(data) + 1
+
+
+def _fill_scalar_sequence(target, value, field: Dict[str, Any], keepalive: List[Any]) -> int:
+    element_type, element_format = _SCALAR_TYPES[field['c_type']]
+    element_size = ctypes.sizeof(element_type)
+    if value is None:
+        value = []
+
+    if numpy is not None and isinstance(value, numpy.ndarray):
+        value = numpy.ascontiguousarray(value, dtype=element_format)
+        keepalive.append(value)
+        address, count = value.ctypes.data, value.size
+    elif isinstance(value, (bytes, bytearray, memoryview)):
+        address, length = _buffer_address(value, keepalive)
+        if length % element_size:
+            raise ValueError(f"Buffer for field '{field['name']}' is not a whole number of {field['c_type']} elements")
+        count = length // element_size
+    else:
+        array = (element_type * len(value))(*value)
+        keepalive.append(array)
+        address, count = ctypes.addressof(array), len(value)
+
+    target.data = ctypes.cast(ctypes.c_void_p(address), ctypes.POINTER(element_type))
+    target.size = count
+    target.capacity = count
+    return 4 + count * (field['size'] or 0)
+
+
+def _fill_element(target, index, value, field: Dict[str, Any], keepalive: List[Any]) -> int:
+    if field['kind'] == 'nested':
+        return _fill_struct(MESSAGE_TYPES[field['nested']], target[index], value, keepalive)
+    return _fill_string(target[index], value, field, keepalive)
+
+
+def _fill_struct(info: Dict[str, Any], target, message: Optional[Dict[str, Any]], keepalive: List[Any]) -> int:
+    # Point target at the Python data in message; returns the serialized size
+    message = message or {}
+    wire_size = 0
+    for field in info['fields']:
+        name = field['name']
+        value = message.get(name)
+        scalar = field['kind'] == 'scalar'
+
+        if field['array'] == 'sequence':
+            sequence = getattr(target, name)
+            if scalar:
+                wire_size += _fill_scalar_sequence(sequence, value, field, keepalive)
+                continue
+            items = list(value or [])
+            array = (_element_type(field) * len(items))()
+            keepalive.append(array)
+            wire_size += 4
+            for index, item in enumerate(items):
+                wire_size += _fill_element(array, index, item, field, keepalive)
+            sequence.data = ctypes.cast(array, ctypes.POINTER(_element_type(field)))
+            sequence.size = len(items)
+            sequence.capacity = len(items)
+        elif field['array'] == 'fixed':
+            array = getattr(target, name)
+            items = [] if value is None else value
+            if len(items) > field['array_size']:
+                raise ValueError(f"Field '{name}' holds at most {field['array_size']} elements")
+            for index, item in enumerate(items):
+                if scalar:
+                    array[index] = item
+                else:
+                    _fill_element(array, index, item, field, keepalive)
+            if scalar:
+                wire_size += field['array_size'] * (field['size'] or 0)
+            else:
+                for index in range(len(items), field['array_size']):
+                    _fill_element(array, index, None, field, keepalive)
+                wire_size += sum(_element_wire_size(field, array[index]) for index in range(field['array_size']))
+        elif field['kind'] == 'nested':
+            wire_size += _fill_struct(MESSAGE_TYPES[field['nested']], getattr(target, name), value, keepalive)
+        elif scalar:
+            if value is not None:
+                setattr(target, name, value)
+            wire_size += field['size'] or 0
+        else:
+            wire_size += _fill_string(getattr(target, name), value, field, keepalive)
+    return wire_size
+
+
+def _element_wire_size(field: Dict[str, Any], element) -> int:
+    if field['kind'] == 'nested':
+        return _struct_wire_size(MESSAGE_TYPES[field['nested']], element)
+    return 4 + element.size + 1
+
+
+def _struct_wire_size(info: Dict[str, Any], struct) -> int:
+    wire_size = 0
+    for field in info['fields']:
+        value = getattr(struct, field['name'])
+        if field['array'] == 'sequence':
+            wire_size += 4
+            if field['kind'] == 'scalar':
+                wire_size += value.size * (field['size'] or 0)
+            else:
+                wire_size += sum(_element_wire_size(field, value.data[index]) for index in range(value.size))
+        elif field['array'] == 'fixed':
+            if field['kind'] == 'scalar':
+                wire_size += field['array_size'] * (field['size'] or 0)
+            else:
+                wire_size += sum(_element_wire_size(field, element) for element in value)
+        elif field['kind'] == 'scalar':
+            wire_size += field['size'] or 0
+        else:
+            wire_size += _element_wire_size(field, value)
+    return wire_size
+
+
+class _Allocations:
+    """Owns the memory a deserializer allocated; freed when no view references it."""
+
+    def __init__(self, library):
+        self.library = library
+        self.pointers = []
+
+    def __del__(self):
+        for pointer in self.pointers:
+            self.library.msg_codecs_free(pointer)
+        self.pointers = []
+
+
+def _collect_allocations(info: Dict[str, Any], struct, allocations: _Allocations):
+    for field in info['fields']:
+        value = getattr(struct, field['name'])
+        if field['array'] == 'sequence':
+            if not value.data:
+                continue
+            if field['kind'] != 'scalar':
+                for index in range(value.size):
+                    _collect_element_allocations(field, value.data[index], allocations)
+            allocations.pointers.append(ctypes.cast(value.data, ctypes.c_void_p))
+        elif field['array'] == 'fixed':
+            if field['kind'] != 'scalar':
+                for element in value:
+                    _collect_element_allocations(field, element, allocations)
+        elif field['kind'] != 'scalar':
+            _collect_element_allocations(field, value, allocations)
+
+
+def _collect_element_allocations(field: Dict[str, Any], element, allocations: _Allocations):
+    if field['kind'] == 'nested':
+        _collect_allocations(MESSAGE_TYPES[field['nested']], element, allocations)
+    elif element.data:
+        allocations.pointers.append(ctypes.cast(element.data, ctypes.c_void_p))
+
+
+def _array_view(array, element_format: str, owner: Optional[_Allocations] = None):
+    if owner is not None:
+        array._owner = owner
+    if numpy is not None:
+        return numpy.frombuffer(array, dtype=element_format)
+    return memoryview(array).cast('B').cast(element_format)
+
+
+def _element_to_python(field: Dict[str, Any], element, owner: _Allocations):
+    if field['kind'] == 'nested':
+        return _to_python(MESSAGE_TYPES[field['nested']], element, owner)
+    return ctypes.string_at(element.data, element.size).decode('utf-8', errors='replace') if element.data else ''
+
+
+def _to_python(info: Dict[str, Any], struct, owner: _Allocations) -> Dict[str, Any]:
+    message = {}
+    for field in info['fields']:
+        name = field['name']
+        value = getattr(struct, name)
+        if field['array'] == 'sequence':
+            if field['kind'] == 'scalar':
+                element_type, element_format = _SCALAR_TYPES[field['c_type']]
+                array = (element_type * value.size).from_address(ctypes.cast(value.data, ctypes.c_void_p).value or 0) if value.size else (element_type * 0)()
+                message[name] = _array_view(array, element_format, owner)
+            else:
+                message[name] = [_element_to_python(field, value.data[index], owner) for index in range(value.size)]
+        elif field['array'] == 'fixed':
+            if field['kind'] == 'scalar':
+                message[name] = _array_view(value, _SCALAR_TYPES[field['c_type']][1])
+            else:
+                message[name] = [_element_to_python(field, element, owner) for element in value]
+        elif field['kind'] == 'scalar':
+            message[name] = value
+        else:
+            message[name] = _element_to_python(field, value, owner)
+    return message
+
+
+class MessageCodec:
+    """serialize/deserialize for one message type, backed by the generated C codec."""
+
+    def __init__(self, library, message_type: str):
+        self.info = _find_message_type(message_type)
+        if not self.info['codec']:
+            raise ValueError(f"{self.info['full_name']} has no generated codec (it is only nested in other messages)")
+        self.library = library
+        self.struct_type = STRUCT_TYPES[self.info['full_name']]
+
+        c_name = self.info['c_type'].lower()
+        expected_size = getattr(library, f"msg_codecs_sizeof_{c_name}")
+        expected_size.restype = ctypes.c_size_t
+        expected_size.argtypes = []
+        if expected_size() != ctypes.sizeof(self.struct_type):
+            raise RuntimeError(f"ctypes layout of {self.info['c_type']} does not match the shared library")
+
+        self._serialize = getattr(library, f"msg_codecs_serialize_{c_name}")
+        self._serialize.restype = ctypes.c_size_t
+        self._serialize.argtypes = [ctypes.POINTER(self.struct_type), ctypes.c_void_p, ctypes.c_size_t]
+        self._deserialize = getattr(library, f"msg_codecs_deserialize_{c_name}")
+        self._deserialize.restype = ctypes.c_size_t
+        self._deserialize.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.POINTER(self.struct_type), ctypes.c_size_t]
+
+    def serialize(self, message: Dict[str, Any], out=None) -> memoryview:
+        """Serialize message into out (or a new bytearray) and return a view of the written bytes."""
+        keepalive = []
+        struct = self.struct_type()
+        wire_size = _fill_struct(self.info, struct, message, keepalive)
+
+        if out is None:
+            out = bytearray(wire_size)
+        address, length = _buffer_address(out, keepalive) if len(out) else (0, 0)
+        written = self._serialize(ctypes.byref(struct), address, length)
+        if written == 0:
+            raise ValueError(f"Failed to serialize {self.info['full_name']} ({wire_size} bytes into a {len(out)} byte buffer)")
+        return memoryview(out)[:written]
+
+    def deserialize(self, data) -> Dict[str, Any]:
+        """Decode data; sequences in the result view memory owned by the result."""
+        keepalive = []
+        struct = self.struct_type()
+        address, length = _buffer_address(data, keepalive)
+        read = self._deserialize(address, length, ctypes.byref(struct), 0)
+
+        # Also after a failure: struct starts zeroed and the codecs zero undecoded sequence
+        # elements, so it holds only NULL or allocated pointers, freed with allocations
+        allocations = _Allocations(self.library)
+        _collect_allocations(self.info, struct, allocations)
+        if read == 0:
+            raise ValueError(f"Failed to deserialize {self.info['full_name']} from {length} bytes")
+        return _to_python(self.info, struct, allocations)
+
+    def wire_size(self, message: Dict[str, Any]) -> int:
+        keepalive = []
+        return _fill_struct(self.info, self.struct_type(), message, keepalive)
+
+
+def _find_message_type(message_type: str) -> Dict[str, Any]:
+    for info in MESSAGE_TYPES.values():
+        if message_type in (info['full_name'], info['c_type']) or message_type.replace('/msg/', '/') == info['full_name'].replace('/msg/', '/'):
+            return info
+    raise ValueError(f"Unknown message type: {message_type}")
+
+
+def load_library(path: Optional[str] = None):
+    """Load the codec shared library from path, ${{ library_env_var }} or next to this module."""
+    path = path or os.environ.get(LIBRARY_ENV_VAR)
+    if path is None:
+        directory = os.path.dirname(os.path.abspath(__file__))
+        for file_name in (f'lib{LIBRARY_NAME}.so', f'lib{LIBRARY_NAME}.dylib', f'{LIBRARY_NAME}.dll'):
+            if os.path.exists(os.path.join(directory, file_name)):
+                path = os.path.join(directory, file_name)
+                break
+        else:
+            raise OSError(f"lib{LIBRARY_NAME} not found in {directory}; build msg_codecs.c or set {LIBRARY_ENV_VAR}")
+
+    library = ctypes.CDLL(path)
+    library.msg_codecs_free.restype = None
+    library.msg_codecs_free.argtypes = [ctypes.c_void_p]
+    return library
+
+
+_default_library = None
+_codecs = {}
+
+
+def get_codec(message_type: str, library=None) -> MessageCodec:
+    global _default_library
+    if library is None:
+        if _default_library is None:
+            _default_library = load_library()
+        library = _default_library
+
+    key = (id(library), message_type)
+    if key not in _codecs:
+        _codecs[key] = MessageCodec(library, message_type)
+    return _codecs[key]
+
+
+def serialize(message_type: str, message: Dict[str, Any], out=None) -> memoryview:
+    return get_codec(message_type).serialize(message, out)
+
+
+def deserialize(message_type: str, data) -> Dict[str, Any]:
+    return get_codec(message_type).deserialize(data)
+'''
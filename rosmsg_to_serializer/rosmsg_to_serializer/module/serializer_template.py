@@ -1,19 +1,70 @@
 #!/usr/bin/env python3
 
 def get_dynamic_serializer_template() -> str:
-    return '''#ifndef SERIALIZE_{{ message.name.upper() }}_H_
-#define SERIALIZE_{{ message.name.upper() }}_H_
+    return '''#ifndef SERIALIZE_{{ message.c_type.upper() }}_H_
+#define SERIALIZE_{{ message.c_type.upper() }}_H_
 
 #include <stddef.h>
 #include <stdint.h>
 #include "common/serialize_utils.h"
+{%- if crc %}
+#include "common/serialize_crc.h"
+{%- endif %}
 
 {%- for msg_type, msg_info in all_messages.items() %}
 // Forward declaration for serializer of {{ msg_type }}
-static size_t serialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower() }}_fields(const {{ msg_info.c_type }}* msg, uint8_t* buffer, size_t buffer_size, size_t offset);
+static size_t serialize_{{ message.c_type.lower() }}_{{ msg_info.c_type.lower() }}_fields(const {{ msg_info.c_type }}* msg, uint8_t* buffer, size_t buffer_size, size_t offset{% if crc %}, msg_crc_state* crc{% endif %});
+{%- endfor %}
+
+{%- for msg_type in all_messages %}
+{{- fragments[msg_type] }}
 {%- endfor %}
 
-{%- macro serialize_field_dynamic(field, var_name, buffer_name, offset_name) %}
+// Main serializer function
+static inline size_t serialize_{{ message.c_type.lower() }}_big_endian(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
+{
+    return serialize_{{ message.c_type.lower() }}_{{ message.c_type.lower() }}_fields(msg, buffer, buffer_size, 0{% if crc %}, NULL{% endif %});
+}
+{%- if crc %}
+
+// Serializer with a {{ crc_name }} trailer, computed while the fields are written
+static inline size_t serialize_{{ message.c_type.lower() }}_big_endian_crc(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
+{
+    msg_crc_state crc;
+    msg_crc_init(&crc);
+    
+    size_t offset = serialize_{{ message.c_type.lower() }}_{{ message.c_type.lower() }}_fields(msg, buffer, buffer_size, 0, &crc);
+    if (offset == 0 || buffer_size - offset < MSG_CRC_TRAILER_SIZE) return 0;
+    
+    msg_crc_advance(&crc, buffer, offset);
+    msg_crc_write_trailer(buffer + offset, msg_crc_finish(&crc));
+    return offset + MSG_CRC_TRAILER_SIZE;
+}
+{%- endif %}
+
+{%- if short_names %}
+
+// Short-name aliases, kept while no other generated message is named {{ message.name }}
+static inline size_t serialize_{{ message.name.lower() }}_big_endian(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
+{
+    return serialize_{{ message.c_type.lower() }}_big_endian(msg, buffer, buffer_size);
+}
+{%- if crc %}
+
+static inline size_t serialize_{{ message.name.lower() }}_big_endian_crc(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
+{
+    return serialize_{{ message.c_type.lower() }}_big_endian_crc(msg, buffer, buffer_size);
+}
+{%- endif %}
+{%- endif %}
+
+#endif // SERIALIZE_{{ message.c_type.upper() }}_H_
+'''
+
+
+def get_dynamic_serializer_fragment_template() -> str:
+    # Functions for one type in the closure; rendered once per type and shared by every header
+    return '''{%- macro serialize_field_dynamic(field, var_name, buffer_name, offset_name) %}
 {%- if field.is_string %}
     // String field: {{ field.name }}
     const uint32_t {{ field.name }}_len = {{ var_name }}->{{ field.name }}.size;
@@ -29,6 +80,29 @@ static size_t serialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower() }}
     virt_memcpy({{ buffer_name }} + {{ offset_name }}, (const uint8_t*){{ var_name }}->{{ field.name }}.data, {{ field.name }}_len);
     {{ buffer_name }}[{{ offset_name }} + {{ field.name }}_len] = '\\0';
     {{ offset_name }} += {{ field.name }}_len_with_null;
+{%- elif field.is_dynamic_array and field.is_builtin and field.size == 1 %}
+    // Byte sequence field: {{ field.name }}
+    const uint32_t {{ field.name }}_size = {{ var_name }}->{{ field.name }}.size;
+    
+    if ({{ offset_name }} + sizeof(uint32_t) + {{ field.name }}_size > buffer_size) {
+        return 0;
+    }
+    
+    serialize_u32_be({{ buffer_name }} + {{ offset_name }}, {{ field.name }}_size);
+    {{ offset_name }} += sizeof(uint32_t);
+    
+    {%- if crc %}
+    if (crc != NULL) {
+        // Copy and checksum the payload in a single pass
+        msg_crc_advance(crc, {{ buffer_name }}, {{ offset_name }});
+        msg_crc_copy(crc, {{ buffer_name }} + {{ offset_name }}, (const uint8_t*){{ var_name }}->{{ field.name }}.data, {{ field.name }}_size);
+    } else {
+        virt_memcpy({{ buffer_name }} + {{ offset_name }}, (const uint8_t*){{ var_name }}->{{ field.name }}.data, {{ field.name }}_size);
+    }
+    {%- else %}
+    virt_memcpy({{ buffer_name }} + {{ offset_name }}, (const uint8_t*){{ var_name }}->{{ field.name }}.data, {{ field.name }}_size);
+    {%- endif %}
+    {{ offset_name }} += {{ field.name }}_size;
 {%- elif field.is_dynamic_array %}
     // Dynamic array field: {{ field.name }}
     const uint32_t {{ field.name }}_size = {{ var_name }}->{{ field.name }}.size;
@@ -42,26 +116,22 @@ static size_t serialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower() }}
     
     for (uint32_t i = 0; i < {{ field.name }}_size; ++i) {
         {%- if field.is_builtin %}
-        {%- if field.size == 1 %}
-        if ({{ offset_name }} + 1 > buffer_size) return 0;
-        {{ buffer_name }}[{{ offset_name }}] = {{ var_name }}->{{ field.name }}.data[i];
-        {{ offset_name }} += 1;
-        {%- elif field.size == 2 %}
+        {%- if field.size == 2 %}
         if ({{ offset_name }} + 2 > buffer_size) return 0;
         serialize_u16_be({{ buffer_name }} + {{ offset_name }}, {{ var_name }}->{{ field.name }}.data[i]);
         {{ offset_name }} += 2;
         {%- elif field.size == 4 %}
         if ({{ offset_name }} + 4 > buffer_size) return 0;
-        serialize_u32_be({{ buffer_name }} + {{ offset_name }}, *(uint32_t*)&{{ var_name }}->{{ field.name }}.data[i]);
+        serialize_u32_be({{ buffer_name }} + {{ offset_name }}, load_u32_bits(&{{ var_name }}->{{ field.name }}.data[i]));
         {{ offset_name }} += 4;
         {%- elif field.size == 8 %}
         if ({{ offset_name }} + 8 > buffer_size) return 0;
-        serialize_u64_be({{ buffer_name }} + {{ offset_name }}, *(uint64_t*)&{{ var_name }}->{{ field.name }}.data[i]);
+        serialize_u64_be({{ buffer_name }} + {{ offset_name }}, load_u64_bits(&{{ var_name }}->{{ field.name }}.data[i]));
         {{ offset_name }} += 8;
         {%- endif %}
         {%- else %}
         // Nested message in array: {{ field.nested_message.name }}
-        size_t {{ field.name }}_nested_result = serialize_{{ message.c_type.lower() }}_{{ field.nested_message.name.lower() }}_fields(&{{ var_name }}->{{ field.name }}.data[i], {{ buffer_name }}, buffer_size, {{ offset_name }});
+        size_t {{ field.name }}_nested_result = serialize_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields(&{{ var_name }}->{{ field.name }}.data[i], {{ buffer_name }}, buffer_size, {{ offset_name }}{% if crc %}, crc{% endif %});
         if ({{ field.name }}_nested_result == 0) return 0;
         {{ offset_name }} = {{ field.name }}_nested_result;
         {%- endif %}
@@ -84,20 +154,20 @@ static size_t serialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower() }}
     {%- elif field.size == 4 %}
     if ({{ offset_name }} + {{ field.array_size * 4 }} > buffer_size) return 0;
     for (int i = 0; i < {{ field.array_size }}; ++i) {
-        serialize_u32_be({{ buffer_name }} + {{ offset_name }}, *(uint32_t*)&{{ var_name }}->{{ field.name }}[i]);
+        serialize_u32_be({{ buffer_name }} + {{ offset_name }}, load_u32_bits(&{{ var_name }}->{{ field.name }}[i]));
         {{ offset_name }} += 4;
     }
     {%- elif field.size == 8 %}
     if ({{ offset_name }} + {{ field.array_size * 8 }} > buffer_size) return 0;
     for (int i = 0; i < {{ field.array_size }}; ++i) {
-        serialize_u64_be({{ buffer_name }} + {{ offset_name }}, *(uint64_t*)&{{ var_name }}->{{ field.name }}[i]);
+        serialize_u64_be({{ buffer_name }} + {{ offset_name }}, load_u64_bits(&{{ var_name }}->{{ field.name }}[i]));
         {{ offset_name }} += 8;
     }
     {%- endif %}
     {%- else %}
     // Nested message array: {{ field.nested_message.name }}
     for (int i = 0; i < {{ field.array_size }}; ++i) {
-        size_t {{ field.name }}_nested_result = serialize_{{ message.c_type.lower() }}_{{ field.nested_message.name.lower() }}_fields(&{{ var_name }}->{{ field.name }}[i], {{ buffer_name }}, buffer_size, {{ offset_name }});
+        size_t {{ field.name }}_nested_result = serialize_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields(&{{ var_name }}->{{ field.name }}[i], {{ buffer_name }}, buffer_size, {{ offset_name }}{% if crc %}, crc{% endif %});
         if ({{ field.name }}_nested_result == 0) return 0;
         {{ offset_name }} = {{ field.name }}_nested_result;
     }
@@ -115,25 +185,23 @@ static size_t serialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower() }}
     {{ offset_name }} += 2;
     {%- elif field.size == 4 %}
     if ({{ offset_name }} + 4 > buffer_size) return 0;
-    serialize_u32_be({{ buffer_name }} + {{ offset_name }}, *(uint32_t*)&{{ var_name }}->{{ field.name }});
+    serialize_u32_be({{ buffer_name }} + {{ offset_name }}, load_u32_bits(&{{ var_name }}->{{ field.name }}));
     {{ offset_name }} += 4;
     {%- elif field.size == 8 %}
     if ({{ offset_name }} + 8 > buffer_size) return 0;
-    serialize_u64_be({{ buffer_name }} + {{ offset_name }}, *(uint64_t*)&{{ var_name }}->{{ field.name }});
+    serialize_u64_be({{ buffer_name }} + {{ offset_name }}, load_u64_bits(&{{ var_name }}->{{ field.name }}));
     {{ offset_name }} += 8;
     {%- endif %}
     {%- else %}
     // Nested message: {{ field.nested_message.name }}
-    size_t {{ field.name }}_nested_result = serialize_{{ message.c_type.lower() }}_{{ field.nested_message.name.lower() }}_fields(&{{ var_name }}->{{ field.name }}, {{ buffer_name }}, buffer_size, {{ offset_name }});
+    size_t {{ field.name }}_nested_result = serialize_{{ prefix }}_{{ field.nested_message.c_type.lower() }}_fields(&{{ var_name }}->{{ field.name }}, {{ buffer_name }}, buffer_size, {{ offset_name }}{% if crc %}, crc{% endif %});
     if ({{ field.name }}_nested_result == 0) return 0;
     {{ offset_name }} = {{ field.name }}_nested_result;
     {%- endif %}
 {%- endif %}
 {%- endmacro %}
-
-{%- for msg_type, msg_info in all_messages.items() %}
 // Serializer for {{ msg_type }}
-static size_t serialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower() }}_fields(const {{ msg_info.c_type }}* msg, uint8_t* buffer, size_t buffer_size, size_t offset)
+static size_t serialize_{{ prefix }}_{{ msg_info.c_type.lower() }}_fields(const {{ msg_info.c_type }}* msg, uint8_t* buffer, size_t buffer_size, size_t offset{% if crc %}, msg_crc_state* crc{% endif %})
 {
     (void)buffer_size;  // Unused in this context, but can be used for buffer size checks
     if (msg == NULL || buffer == NULL) {
@@ -142,17 +210,11 @@ static size_t serialize_{{ message.c_type.lower() }}_{{ msg_info.name.lower() }}
     
 {%- for field in msg_info.fields %}
     {{ serialize_field_dynamic(field, "msg", "buffer", "offset") }}
+    {%- if crc %}
+    if (crc != NULL) msg_crc_advance(crc, buffer, offset);
+    {%- endif %}
 {%- endfor %}
     
     return offset;
 }
-{%- endfor %}
-
-// Main serializer function
-size_t serialize_{{ message.name.lower() }}_big_endian(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
-{
-    return serialize_{{ message.c_type.lower() }}_{{ message.name.lower() }}_fields(msg, buffer, buffer_size, 0);
-}
-
-#endif // SERIALIZE_{{ message.name.upper() }}_H_
-'''
\ No newline at end of file
+'''
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+import os
+import mmap
+import struct
+import time
+from typing import Iterator, Optional
+
+
+# Layout of common/shm_ring.h; keep in sync with DynamicTypeGenerator._generate_shm_ring()
+SHM_RING_MAGIC = 0x4D534752
+SHM_RING_VERSION = 1
+SHM_RING_HEADER_SIZE = 192
+SHM_RING_SLOT_HEADER_SIZE = 8
+_HEAD_OFFSET = 64
+_TAIL_OFFSET = 128
+_U32 = struct.Struct('=I')
+_HEADER = struct.Struct('=IIII')
+
+
+class ShmRingReader:
+    """Consumer side of a shared-memory ring created by msg_shm_ring_create().
+
+    Payloads are returned as bytes in the project's big-endian wire format.
+    The shared memory object is looked up under /dev/shm, so this reader is
+    Linux-only. Python cannot issue acquire/release fences, so the reader
+    relies on the host's store ordering (x86-64); on weakly ordered CPUs use
+    the C consumer instead.
+    """
+
+    def __init__(self, name: str, shm_dir: str = '/dev/shm'):
+        path = os.path.join(shm_dir, name.lstrip('/'))
+        fd = os.open(path, os.O_RDWR)
+        try:
+            size = os.fstat(fd).st_size
+            if size < SHM_RING_HEADER_SIZE:
+                raise ValueError(f"{path} is too small to hold a shared-memory ring")
+            self.memory = mmap.mmap(fd, size)
+        finally:
+            os.close(fd)
+
+        magic, version, self.slot_count, self.slot_size = _HEADER.unpack_from(self.memory, 0)
+        if magic != SHM_RING_MAGIC or version != SHM_RING_VERSION:
+            self.memory.close()
+            raise ValueError(f"{path} is not a version {SHM_RING_VERSION} shared-memory ring")
+        self.slot_stride = SHM_RING_SLOT_HEADER_SIZE + self.slot_size
+        if SHM_RING_HEADER_SIZE + self.slot_count * self.slot_stride > size:
+            self.memory.close()
+            raise ValueError(f"{path} is smaller than its ring geometry")
+
+    def __enter__(self) -> 'ShmRingReader':
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.memory.close()
+
+    def pending(self) -> int:
+        head = _U32.unpack_from(self.memory, _HEAD_OFFSET)[0]
+        tail = _U32.unpack_from(self.memory, _TAIL_OFFSET)[0]
+        return (head - tail) & 0xFFFFFFFF
+
+    def read(self) -> Optional[bytes]:
+        """Copy out the oldest payload and release its slot, or return None if the ring is empty."""
+        tail = _U32.unpack_from(self.memory, _TAIL_OFFSET)[0]
+        head = _U32.unpack_from(self.memory, _HEAD_OFFSET)[0]
+        if head == tail:
+            return None
+
+        slot = SHM_RING_HEADER_SIZE + (tail & (self.slot_count - 1)) * self.slot_stride
+        length = min(_U32.unpack_from(self.memory, slot)[0], self.slot_size)
+        payload_start = slot + SHM_RING_SLOT_HEADER_SIZE
+        payload = self.memory[payload_start:payload_start + length]
+
+        _U32.pack_into(self.memory, _TAIL_OFFSET, (tail + 1) & 0xFFFFFFFF)
+        return payload
+
+    def __iter__(self) -> Iterator[bytes]:
+        # Drain what is currently in the ring
+        while True:
+            payload = self.read()
+            if payload is None:
+                return
+            yield payload
+
+    def wait(self, timeout: Optional[float] = None, poll_interval: float = 0.0001) -> Optional[bytes]:
+        """Busy-poll read() until a payload arrives or timeout seconds pass."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            payload = self.read()
+            if payload is not None:
+                return payload
+            if deadline is not None and time.monotonic() >= deadline:
+                return None
+            time.sleep(poll_interval)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description='Dump payloads from a rosmsg_to_serializer shared-memory ring')
+    parser.add_argument('name', help='Shared memory object name, e.g. /image_ring')
+    parser.add_argument('--count', type=int, default=0, help='Stop after this many payloads (default: run forever)')
+    parser.add_argument('--timeout', type=float, help='Give up after this many seconds without a payload')
+
+    args = parser.parse_args()
+
+    received = 0
+    with ShmRingReader(args.name) as reader:
+        while not args.count or received < args.count:
+            payload = reader.wait(args.timeout)
+            if payload is None:
+                break
+            received += 1
+            print(f"{len(payload)} bytes: {payload.hex()}")
+
+    return 0
+
+
+if __name__ == '__main__':
+    import sys
+    sys.exit(main())
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+def get_shm_ring_template() -> str:
+    return '''#ifndef SHM_RING_{{ message.c_type.upper() }}_H_
+#define SHM_RING_{{ message.c_type.upper() }}_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include "common/shm_ring.h"
+#include "{{ message.package }}/{{ message.name }}/serialize.h"
+#include "{{ message.package }}/{{ message.name }}/deserialize.h"
+
+// Serialize msg straight into the next free slot of a shared-memory ring.
+// Returns the serialized length, 0 if the ring is full (retry later), or
+// MSG_SHM_RING_TOO_LARGE if msg does not fit in a slot (retrying cannot help).
+static inline ptrdiff_t write_{{ message.c_type.lower() }}_shm_ring(msg_shm_ring* ring, const {{ message.c_type }}* msg)
+{
+    size_t capacity;
+    uint8_t* slot = msg_shm_ring_reserve(ring, &capacity);
+    if (slot == NULL) return 0;
+    
+    size_t length = serialize_{{ message.c_type.lower() }}_big_endian(msg, slot, capacity);
+    if (length == 0) return MSG_SHM_RING_TOO_LARGE;
+    
+    msg_shm_ring_commit(ring, length);
+    return (ptrdiff_t)length;
+}
+
+// Deserialize the oldest message of a shared-memory ring and release its slot.
+// Returns the consumed length, 0 if the ring is empty, or MSG_SHM_RING_MALFORMED
+// if the payload failed to decode (its slot is released all the same, so the
+// next call moves on). To read fields without decoding, use msg_shm_ring_peek()
+// and msg_shm_ring_release() directly.
+static inline ptrdiff_t read_{{ message.c_type.lower() }}_shm_ring(msg_shm_ring* ring, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    size_t length;
+    const uint8_t* slot = msg_shm_ring_peek(ring, &length);
+    if (slot == NULL) return 0;
+    
+    size_t consumed = deserialize_{{ message.c_type.lower() }}_big_endian(slot, length, msg, max_string_buffer_size);
+    msg_shm_ring_release(ring);
+    return consumed != 0 ? (ptrdiff_t)consumed : MSG_SHM_RING_MALFORMED;
+}
+{%- if short_names %}
+
+// Short-name aliases, kept while no other generated message is named {{ message.name }}
+static inline ptrdiff_t write_{{ message.name.lower() }}_shm_ring(msg_shm_ring* ring, const {{ message.c_type }}* msg)
+{
+    return write_{{ message.c_type.lower() }}_shm_ring(ring, msg);
+}
+
+static inline ptrdiff_t read_{{ message.name.lower() }}_shm_ring(msg_shm_ring* ring, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    return read_{{ message.c_type.lower() }}_shm_ring(ring, msg, max_string_buffer_size);
+}
+{%- endif %}
+
+#endif // SHM_RING_{{ message.c_type.upper() }}_H_
+'''
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+def get_table_descriptor_template() -> str:
+    return '''#ifndef MSG_DESCRIPTOR_{{ message.c_type.upper() }}_H_
+#define MSG_DESCRIPTOR_{{ message.c_type.upper() }}_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include "common/table_codec.h"
+{%- for nested_type in nested_types %}
+#include "{{ nested_type.package }}/{{ nested_type.name }}/descriptor.h"
+{%- endfor %}
+
+// Field descriptors for {{ message.full_name }}
+{%- if wire_fields %}
+static const msg_field_descriptor {{ message.c_type }}__field_descriptors[{{ wire_fields | length }}] = {
+{%- for field in wire_fields %}
+    {
+        offsetof({{ message.c_type }}, {{ field.name }}),
+        {%- if field.is_string %}
+        MSG_FIELD_KIND_STRING, 0,
+        {%- elif field.is_builtin %}
+        MSG_FIELD_KIND_SCALAR, {{ field.size }},
+        {%- else %}
+        MSG_FIELD_KIND_NESTED, 0,
+        {%- endif %}
+        {%- if field.is_dynamic_array %}
+        MSG_FIELD_ARRAY_SEQUENCE, 0,
+        {%- elif field.is_array %}
+        MSG_FIELD_ARRAY_FIXED, {{ field.array_size }},
+        {%- else %}
+        MSG_FIELD_ARRAY_NONE, 0,
+        {%- endif %}
+        sizeof({{ field.c_type }}),
+        {%- if field.nested_message %}
+        &{{ field.nested_message.c_type }}__descriptor
+        {%- else %}
+        NULL
+        {%- endif %}
+    },
+{%- endfor %}
+};
+{%- endif %}
+
+static const msg_type_descriptor {{ message.c_type }}__descriptor = {
+    sizeof({{ message.c_type }}),
+    {{ min_wire_size }},
+    {{ wire_fields | length }},
+    {%- if wire_fields %}
+    {{ message.c_type }}__field_descriptors
+    {%- else %}
+    NULL
+    {%- endif %}
+};
+
+#endif // MSG_DESCRIPTOR_{{ message.c_type.upper() }}_H_
+'''
+
+
+def get_table_serializer_template() -> str:
+    return '''#ifndef SERIALIZE_{{ message.c_type.upper() }}_H_
+#define SERIALIZE_{{ message.c_type.upper() }}_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include "common/serialize_utils.h"
+#include "common/table_codec.h"
+{%- if crc %}
+#include "common/serialize_crc.h"
+{%- endif %}
+#include "{{ message.package }}/{{ message.name }}/descriptor.h"
+
+// Table-driven serializer for {{ message.full_name }}
+static inline size_t serialize_{{ message.c_type.lower() }}_big_endian(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
+{
+    return msg_table_serialize(&{{ message.c_type }}__descriptor, msg, buffer, buffer_size);
+}
+{%- if crc %}
+
+// Serializer with a {{ crc_name }} trailer; the table backend checksums the
+// payload in a second pass over the buffer
+static inline size_t serialize_{{ message.c_type.lower() }}_big_endian_crc(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
+{
+    size_t offset = msg_table_serialize(&{{ message.c_type }}__descriptor, msg, buffer, buffer_size);
+    if (offset == 0 || buffer_size - offset < MSG_CRC_TRAILER_SIZE) return 0;
+    
+    msg_crc_state crc;
+    msg_crc_init(&crc);
+    msg_crc_update(&crc, buffer, offset);
+    msg_crc_write_trailer(buffer + offset, msg_crc_finish(&crc));
+    return offset + MSG_CRC_TRAILER_SIZE;
+}
+{%- endif %}
+
+{%- if short_names %}
+
+// Short-name aliases, kept while no other generated message is named {{ message.name }}
+static inline size_t serialize_{{ message.name.lower() }}_big_endian(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
+{
+    return serialize_{{ message.c_type.lower() }}_big_endian(msg, buffer, buffer_size);
+}
+{%- if crc %}
+
+static inline size_t serialize_{{ message.name.lower() }}_big_endian_crc(const {{ message.c_type }}* msg, uint8_t* buffer, size_t buffer_size)
+{
+    return serialize_{{ message.c_type.lower() }}_big_endian_crc(msg, buffer, buffer_size);
+}
+{%- endif %}
+{%- endif %}
+
+#endif // SERIALIZE_{{ message.c_type.upper() }}_H_
+'''
+
+
+def get_table_deserializer_template() -> str:
+    return '''#ifndef DESERIALIZE_{{ message.c_type.upper() }}_H_
+#define DESERIALIZE_{{ message.c_type.upper() }}_H_
+
+#include <stddef.h>
+#include <stdint.h>
+#include <stdlib.h>
+#include "common/serialize_utils.h"
+#include "common/table_codec.h"
+{%- if crc %}
+#include "common/serialize_crc.h"
+{%- endif %}
+#include "{{ message.package }}/{{ message.name }}/descriptor.h"
+
+// Table-driven deserializer for {{ message.full_name }}
+// Note: String fields and sequences allocate individual memory blocks that must be freed by the caller
+static inline size_t deserialize_{{ message.c_type.lower() }}_big_endian(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    (void)max_string_buffer_size; // Not used with individual string allocation
+    return msg_table_deserialize(&{{ message.c_type }}__descriptor, buffer, buffer_size, msg);
+}
+{%- if crc %}
+
+// Deserializer for buffers carrying a {{ crc_name }} trailer.
+// Returns 0 if the trailer does not match; fields decoded so far may already hold allocated memory.
+static inline size_t deserialize_{{ message.c_type.lower() }}_big_endian_crc(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    (void)max_string_buffer_size; // Not used with individual string allocation
+    if (buffer == NULL || buffer_size < MSG_CRC_TRAILER_SIZE) return 0;
+    
+    size_t offset = msg_table_deserialize(&{{ message.c_type }}__descriptor, buffer, buffer_size - MSG_CRC_TRAILER_SIZE, msg);
+    if (offset == 0) return 0;
+    
+    msg_crc_state crc;
+    msg_crc_init(&crc);
+    msg_crc_update(&crc, buffer, offset);
+    if (msg_crc_read_trailer(buffer + offset) != msg_crc_finish(&crc)) return 0;
+    return offset + MSG_CRC_TRAILER_SIZE;
+}
+{%- endif %}
+
+{%- if short_names %}
+
+// Short-name aliases, kept while no other generated message is named {{ message.name }}
+static inline size_t deserialize_{{ message.name.lower() }}_big_endian(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    return deserialize_{{ message.c_type.lower() }}_big_endian(buffer, buffer_size, msg, max_string_buffer_size);
+}
+{%- if crc %}
+
+static inline size_t deserialize_{{ message.name.lower() }}_big_endian_crc(const uint8_t* buffer, size_t buffer_size, {{ message.c_type }}* msg, size_t max_string_buffer_size)
+{
+    return deserialize_{{ message.c_type.lower() }}_big_endian_crc(buffer, buffer_size, msg, max_string_buffer_size);
+}
+{%- endif %}
+{%- endif %}
+
+#endif // DESERIALIZE_{{ message.c_type.upper() }}_H_
+'''
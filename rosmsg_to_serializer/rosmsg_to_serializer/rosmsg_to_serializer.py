@@ -3,51 +3,135 @@
 import os
 import sys
 import argparse
+from collections import Counter
 from pathlib import Path
 
-from .module.dynamic_serializer_generator import DynamicCodeGenerator
-from .module.dynamic_type_generator import DynamicTypeGenerator
+from .module.generator_client import USE_SERVER_ENV_VAR, request_generation, server_requested
 
 
 def main():
     parser = argparse.ArgumentParser(description='Generate C/C++ serializers and deserializers from ROS2 message definitions dynamically')
-    parser.add_argument('--output-dir', required=True)
+    parser.add_argument('--output-dir')
     parser.add_argument('--messages', nargs='*')
+    parser.add_argument('--packages', nargs='*',
+                        help='Generate every message of these packages (in addition to --messages)')
+    parser.add_argument('--iovec', action='store_true',
+                        help='Also generate scatter-gather (iovec) serializers that reference large byte sequences in place')
+    parser.add_argument('--accessors', action='store_true',
+                        help='Also generate in-place field accessors and get_<type>_wire_length (access.h)')
+    parser.add_argument('--shm-ring', action='store_true',
+                        help='Also generate shared-memory ring transport helpers (write_/read_<type>_shm_ring)')
+    parser.add_argument('--crc', choices=['crc32', 'crc16'],
+                        help='Also generate *_big_endian_crc functions that append/verify a checksum trailer computed in the same pass')
+    parser.add_argument('--python-bindings', action='store_true',
+                        help='Also generate ctypes Python bindings (python/msg_codecs.py) and the C source of their shared library')
+    parser.add_argument('--table-driven', nargs='*', default=[],
+                        help='Messages to generate as compact descriptor tables instead of unrolled functions')
+    parser.add_argument('--depfile',
+                        help='Write a Makefile/Ninja-style dependency file mapping generated headers to message definitions')
+    parser.add_argument('--stamp',
+                        help='Touch this file after every successful run and make it the only target of --depfile')
+    parser.add_argument('--serve', action='store_true',
+                        help='Run a warm generator server that handles requests from later invocations')
+    parser.add_argument('--socket',
+                        help='Generator server socket path (default: $ROSMSG_TO_SERIALIZER_SOCKET or a per-user runtime path)')
+    parser.add_argument('--use-server', action='store_true',
+                        help=f'Delegate generation to a running generator server (also enabled by ${USE_SERVER_ENV_VAR}=1); '
+                             'falls back to in-process generation if none answers')
+    parser.add_argument('--no-server', action='store_true',
+                        help=f'Always generate in-process, even if ${USE_SERVER_ENV_VAR} is set')
     
     args = parser.parse_args()
     
+    if args.serve:
+        from .module.generator_server import GeneratorServer
+        try:
+            GeneratorServer(args.socket).serve_forever()
+        except Exception as e:
+            print(f"Error: {e}")
+            return 1
+        return 0
+    
+    if not args.output_dir:
+        parser.error('--output-dir is required')
+    
     default_messages = [
         'geometry_msgs/msg/Twist',
         'geometry_msgs/msg/PoseStamped',
         'geometry_msgs/msg/PoseWithCovarianceStamped'
     ]
     
-    messages = args.messages if args.messages else default_messages
+    packages = args.packages or []
+    messages = args.messages or []
+    if not messages and not packages and not args.table_driven:
+        messages = default_messages
+    messages = list(dict.fromkeys(messages + args.table_driven))
+    
+    output_dir = Path(args.output_dir).resolve()
+    
+    if (args.use_server or server_requested()) and not args.no_server:
+        response = request_generation({
+            'command': 'generate',
+            'output_dir': str(output_dir),
+            'messages': messages,
+            'packages': packages,
+            'iovec': args.iovec,
+            'accessors': args.accessors,
+            'shm_ring': args.shm_ring,
+            'crc': args.crc,
+            'python_bindings': args.python_bindings,
+            'table_driven': args.table_driven,
+            'depfile': str(Path(args.depfile).resolve()) if args.depfile else None,
+            'stamp': str(Path(args.stamp).resolve()) if args.stamp else None,
+        }, args.socket)
+        if response is not None:
+            print(response.get('output', ''), end='')
+            return response.get('status', 1)
     
-    output_dir = Path(args.output_dir)
+    return generate(messages, output_dir, iovec=args.iovec, depfile=args.depfile, packages=packages, table_driven=args.table_driven, accessors=args.accessors, shm_ring=args.shm_ring, crc=args.crc, python_bindings=args.python_bindings, stamp=args.stamp)
+
+
+def generate(messages: list, output_dir: Path, iovec: bool = False, depfile=None, analyzer=None, serializer_generator=None, packages=None, table_driven=None, accessors: bool = False, shm_ring: bool = False, crc=None, python_bindings: bool = False, stamp=None) -> int:
+    from .module.dynamic_serializer_generator import DynamicMessageAnalyzer
+    from .module.dynamic_type_generator import DynamicTypeGenerator
+    from .module.generated_files import write_generated_files
     
     for msg in messages:
         print(f"  - {msg}")
     
     try:
-        type_generator = DynamicTypeGenerator()
-        type_generator.generate_type_definitions(messages, str(output_dir))
+        if analyzer is None:
+            analyzer = DynamicMessageAnalyzer()
         
-        template_dir = Path(__file__).parent / 'templates'
-        template_dir.mkdir(exist_ok=True)
+        if packages:
+            messages = list(messages) + discover_messages(packages, analyzer)
+            # Keep the first occurrence of each message
+            messages = list(dict.fromkeys(messages))
         
-        serializer_generator = DynamicCodeGenerator(str(template_dir))
+        failed = []
         
-        for msg_type in messages:
-            try:
-                serializer_generator.generate_serializer(msg_type, str(output_dir))
-                print(f"  ✅ {msg_type}")
-            except Exception as e:
-                print(f"  ❌ {msg_type}: {e}")
+        def progress(msg_type, error=None):
+            _print_progress(msg_type, error)
+            if error is not None:
+                failed.append(msg_type)
         
+        files = render_serializers(messages, iovec=iovec, analyzer=analyzer, serializer_generator=serializer_generator, table_driven=table_driven, accessors=accessors, shm_ring=shm_ring, crc=crc, python_bindings=python_bindings, progress=progress)
+        if failed:
+            # Nothing is written, so the build fails instead of linking against missing headers
+            print(f"Error: failed to generate {len(failed)} message(s): {', '.join(failed)}")
+            return 1
         print("3: generate_integration_headers")
-        generate_integration_headers(output_dir, messages)
         print("Generated integration headers successfully.")
+        if depfile:
+            depfile_path = Path(depfile).resolve()
+            files[str(depfile_path)] = DynamicTypeGenerator(analyzer).render_depfile(messages, str(output_dir), iovec=iovec, table_driven=table_driven, accessors=accessors, shm_ring=shm_ring, python_bindings=python_bindings, stamp=stamp)
+        
+        write_generated_files(files, str(output_dir))
+        if stamp:
+            # Unchanged headers keep their timestamps; the stamp records that this run happened
+            stamp_path = Path(stamp)
+            stamp_path.parent.mkdir(parents=True, exist_ok=True)
+            stamp_path.touch()
         
     except Exception as e:
         print(f"Error: {e}")
@@ -56,14 +140,104 @@ def main():
     return 0
 
 
-def generate_integration_headers(output_dir: Path, messages: list):
+def _print_progress(msg_type: str, error=None):
+    if error is None:
+        print(f"  ✅ {msg_type}")
+    else:
+        print(f"  ❌ {msg_type}: {error}")
+
+
+def discover_messages(packages: list, analyzer) -> list:
+    messages = []
+    for package_name in packages:
+        package_messages = analyzer.discover_package_messages(package_name)
+        print(f"  - {package_name}: {len(package_messages)} messages")
+        for msg_type in package_messages:
+            try:
+                analyzer.analyze_message_type(msg_type)
+            except ValueError as e:
+                print(f"  ❌ {msg_type}: {e}")
+                continue
+            messages.append(msg_type)
+    return messages
+
+
+def render_serializers(messages: list, iovec: bool = False, analyzer=None, serializer_generator=None, table_driven=None, accessors: bool = False, shm_ring: bool = False, crc=None, python_bindings: bool = False, progress=None) -> dict:
+    """Render all generated headers in memory.
+    
+    Returns a mapping of path (relative to the output directory) to file
+    content; commit it with write_generated_files(). Messages that fail to
+    render are left out of every output, including the integration header and
+    bindings; progress(msg_type, error) is called for each message, with error
+    None on success.
+    """
+    from .module.dynamic_serializer_generator import DynamicCodeGenerator
+    from .module.dynamic_type_generator import DynamicTypeGenerator
+    
+    type_generator = DynamicTypeGenerator(analyzer)
+    table_driven = {type_generator.analyzer.analyze_message_type(msg_type)['full_name'] for msg_type in table_driven or []}
+    files = type_generator.render_type_definitions(messages, iovec=iovec, table_codec=bool(table_driven), accessors=accessors, shm_ring=shm_ring, crc=crc)
+    
+    if serializer_generator is None:
+        template_dir = Path(__file__).parent / 'templates'
+        serializer_generator = DynamicCodeGenerator(str(template_dir), type_generator.analyzer)
+    
+    # Short-name aliases are only emitted for names that stay unique across the generated set
+    name_counts = Counter(msg_type.split('/')[-1] for msg_type in messages)
+    
+    failed = set()
+    for msg_type in messages:
+        try:
+            short_names = name_counts[msg_type.split('/')[-1]] == 1
+            if type_generator.analyzer.analyze_message_type(msg_type)['full_name'] in table_driven:
+                message_files = serializer_generator.render_table_serializer(msg_type, crc=crc, short_names=short_names)
+            else:
+                message_files = serializer_generator.render_serializer(msg_type, crc=crc, short_names=short_names)
+            if iovec:
+                message_files.update(serializer_generator.render_iovec_serializer(msg_type, short_names=short_names))
+            if accessors:
+                message_files.update(serializer_generator.render_accessors(msg_type, short_names=short_names))
+            if shm_ring:
+                message_files.update(serializer_generator.render_shm_ring(msg_type, short_names=short_names))
+            files.update(message_files)
+            if progress is not None:
+                progress(msg_type)
+        except Exception as e:
+            failed.add(msg_type)
+            if progress is not None:
+                progress(msg_type, e)
+    
+    messages = [msg_type for msg_type in messages if msg_type not in failed]
+    files['dynamic_serializer_integration.h'] = render_integration_header(messages, iovec=iovec, accessors=accessors, shm_ring=shm_ring, crc=crc)
+    files.update(type_generator.render_message_headers(messages, iovec=iovec, accessors=accessors, shm_ring=shm_ring))
+    if python_bindings:
+        files.update(serializer_generator.render_python_bindings(messages))
+    
+    return files
+
+
+def generate_integration_headers(output_dir: Path, messages: list, iovec: bool = False, accessors: bool = False, shm_ring: bool = False, crc=None):
+    from .module.generated_files import write_generated_files
+    
+    write_generated_files({'dynamic_serializer_integration.h': render_integration_header(messages, iovec=iovec, accessors=accessors, shm_ring=shm_ring, crc=crc)}, str(output_dir))
+
+
+def render_integration_header(messages: list, iovec: bool = False, accessors: bool = False, shm_ring: bool = False, crc=None) -> str:
     integration_header = '''#ifndef DYNAMIC_SERIALIZER_INTEGRATION_H_
 #define DYNAMIC_SERIALIZER_INTEGRATION_H_
 
 #include "common/dynamic_types.h"
 #include "common/serialize_utils.h"
-
 '''
+    if iovec:
+        integration_header += '#include "common/serialize_iovec.h"\n'
+    if accessors:
+        integration_header += '#include "common/serialize_access.h"\n'
+    if shm_ring:
+        integration_header += '#include "common/shm_ring.h"\n'
+    if crc:
+        integration_header += '#include "common/serialize_crc.h"\n'
+    integration_header += '\n'
     
     for msg_type in messages:
         parts = msg_type.split('/')
@@ -73,13 +247,18 @@ def generate_integration_headers(output_dir: Path, messages: list):
             
             integration_header += f'#include "{package_name}/{message_name}/serialize.h"\n'
             integration_header += f'#include "{package_name}/{message_name}/deserialize.h"\n'
+            if iovec:
+                integration_header += f'#include "{package_name}/{message_name}/serialize_iovec.h"\n'
+            if accessors:
+                integration_header += f'#include "{package_name}/{message_name}/access.h"\n'
+            if shm_ring:
+                integration_header += f'#include "{package_name}/{message_name}/shm_ring.h"\n'
     
     integration_header += '''
 #endif // DYNAMIC_SERIALIZER_INTEGRATION_H_
 '''
     
-    with open(output_dir / 'dynamic_serializer_integration.h', 'w') as f:
-        f.write(integration_header)
+    return integration_header
 
 
 if __name__ == '__main__':
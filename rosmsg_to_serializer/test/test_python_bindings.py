@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+import importlib.util
+import os
+import shutil
+import subprocess
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip('sensor_msgs.msg')
+pytest.importorskip('nav_msgs.msg')
+
+from rosmsg_to_serializer import render_serializers
+from rosmsg_to_serializer.module.generated_files import write_generated_files
+
+
+SAMPLES = {
+    'sensor_msgs/msg/Image': {
+        'header': {'stamp': {'sec': 5, 'nanosec': 7}, 'frame_id': 'camera'},
+        'height': 2,
+        'width': 3,
+        'encoding': 'mono8',
+        'step': 3,
+        'data': bytes(range(6)),
+    },
+    # boolean fields take one byte on the wire
+    'std_msgs/msg/Bool': {'data': True},
+    # A sequence of messages that own strings; long frame ids keep truncated frames
+    # past the sequence count bound, so decoding stops inside the allocated elements
+    'nav_msgs/msg/Path': {
+        'header': {'frame_id': 'map'},
+        'poses': [
+            {'header': {'frame_id': f'odom/pose{index}/' + 'x' * 64}, 'pose': {'position': {'x': float(index)}, 'orientation': {'w': 1.0}}}
+            for index in range(3)
+        ],
+    },
+}
+
+
+def _include_dirs():
+    # rosidl C headers live in <prefix>/include/<package> (Humble and later) or <prefix>/include
+    include_dirs = []
+    for prefix in filter(None, os.environ.get('AMENT_PREFIX_PATH', '').split(os.pathsep)):
+        include_dir = Path(prefix) / 'include'
+        if include_dir.is_dir():
+            include_dirs.append(include_dir)
+            include_dirs.extend(path for path in sorted(include_dir.iterdir()) if path.is_dir())
+    return include_dirs
+
+
+@pytest.fixture(scope='module')
+def codecs(tmp_path_factory):
+    compiler = shutil.which(os.environ.get('CC', 'cc'))
+    if compiler is None:
+        pytest.skip('no C compiler to build the codec library')
+
+    output_dir = tmp_path_factory.mktemp('generated')
+    write_generated_files(render_serializers(list(SAMPLES), python_bindings=True), str(output_dir))
+
+    library_path = output_dir / 'python' / 'libmsg_serializer_codecs.so'
+    command = [compiler, '-O1', '-std=c99', '-fPIC', '-shared', f'-I{output_dir}']
+    command += [f'-I{include_dir}' for include_dir in _include_dirs()]
+    command += ['-o', str(library_path), str(output_dir / 'python' / 'msg_codecs.c')]
+    subprocess.run(command, check=True)
+
+    spec = importlib.util.spec_from_file_location('msg_codecs', output_dir / 'python' / 'msg_codecs.py')
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    library = module.load_library(str(library_path))
+    return {message_type: module.get_codec(message_type, library) for message_type in SAMPLES}
+
+
+@pytest.mark.parametrize('message_type', list(SAMPLES))
+def test_round_trip(codecs, message_type):
+    codec = codecs[message_type]
+    frame = bytes(codec.serialize(SAMPLES[message_type]))
+    assert bytes(codec.serialize(codec.deserialize(frame))) == frame
+
+
+@pytest.mark.parametrize('message_type', list(SAMPLES))
+def test_truncated_frames_are_rejected(codecs, message_type):
+    codec = codecs[message_type]
+    frame = bytes(codec.serialize(SAMPLES[message_type]))
+    for length in range(len(frame)):
+        with pytest.raises(ValueError):
+            codec.deserialize(frame[:length])
+
+
+def test_oversized_sequence_count_is_rejected(codecs):
+    codec = codecs['nav_msgs/msg/Path']
+    frame = bytearray(codec.serialize({'header': {'frame_id': 'map'}}))
+    # The poses count is the last field of an empty path
+    frame[-4:] = (0xFFFFFFFF).to_bytes(4, 'big')
+    with pytest.raises(ValueError):
+        codec.deserialize(bytes(frame))
+
+
+def test_zero_string_length_is_rejected(codecs):
+    codec = codecs['sensor_msgs/msg/Image']
+    frame = bytearray(codec.serialize(dict(SAMPLES['sensor_msgs/msg/Image'], header={'frame_id': ''})))
+    # An empty frame_id is a length of 1 (its NUL) after the 8-byte stamp; a length
+    # of 0 cannot carry the NUL, so drop it and keep the rest of the frame aligned
+    frame[8:13] = (0).to_bytes(4, 'big')
+    with pytest.raises(ValueError):
+        codec.deserialize(bytes(frame))
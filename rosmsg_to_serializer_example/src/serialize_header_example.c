@@ -25,7 +25,7 @@ int serialize_header_example(void) {
     printf("Original Frame ID: '%s'\n", original_header.frame_id.data);
     printf("Original Timestamp: %d.%09u\n", original_header.stamp.sec, original_header.stamp.nanosec);
     
-    size_t written_bytes = serialize_header_big_endian(&original_header, serialized_buffer, sizeof(serialized_buffer));
+    size_t written_bytes = serialize_std_msgs__msg__header_big_endian(&original_header, serialized_buffer, sizeof(serialized_buffer));
     
     if (written_bytes > 0)
     {
@@ -43,21 +43,21 @@ int serialize_header_example(void) {
     printf("--- 2. Deserialization ---\n");
     std_msgs__msg__Header deserialized_header;
     
-    printf("DEBUG: About to call deserialize_header_big_endian\n");
+    printf("DEBUG: About to call deserialize_std_msgs__msg__header_big_endian\n");
     printf("DEBUG: serialized_buffer first 20 bytes: ");
     for(size_t i = 0; i < 20 && i < written_bytes; ++i) {
         printf("%02X ", serialized_buffer[i]);
     }
     printf("\n");
     
-    size_t read_bytes = deserialize_header_big_endian(
+    size_t read_bytes = deserialize_std_msgs__msg__header_big_endian(
         serialized_buffer, 
         written_bytes, 
         &deserialized_header,
         256  // max_string_buffer_size
     );
     
-    printf("DEBUG: deserialize_header_big_endian returned %zu\n", read_bytes);
+    printf("DEBUG: deserialize_std_msgs__msg__header_big_endian returned %zu\n", read_bytes);
 
     if (read_bytes > 0)
     {
@@ -46,7 +46,7 @@ int serialize_image_example(void) {
     original_image.data.capacity = sizeof(image_8x8);
 
     uint8_t serialized_buffer[256];
-    size_t written_bytes = serialize_image_big_endian(&original_image, serialized_buffer, sizeof(serialized_buffer));
+    size_t written_bytes = serialize_sensor_msgs__msg__image_big_endian(&original_image, serialized_buffer, sizeof(serialized_buffer));
 
     if (written_bytes > 0) {
         printf("Serialized %zu bytes (hex): ", written_bytes);
@@ -63,7 +63,7 @@ int serialize_image_example(void) {
     printf("--- 2. Deserialization ---\n");
     sensor_msgs__msg__Image deserialized_image;
     // sensor_msgs__msg__Image__init(&deserialized_image);
-    size_t read_bytes = deserialize_image_big_endian(
+    size_t read_bytes = deserialize_sensor_msgs__msg__image_big_endian(
         serialized_buffer, 
         written_bytes, 
         &deserialized_image,
@@ -0,0 +1,150 @@
+#define _POSIX_C_SOURCE 200809L
+
+#include <sched.h>
+#include <signal.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <string.h>
+#include <sys/types.h>
+#include <sys/wait.h>
+#include <unistd.h>
+
+#include "dynamic_serializer_integration.h"
+
+#define RING_NAME "/rosmsg_to_serializer_example"
+#define RING_SLOTS 8
+#define RING_SLOT_SIZE 256
+#define MESSAGE_COUNT 1000
+
+static void fill_image(sensor_msgs__msg__Image* image, uint8_t* pixels, uint32_t sequence)
+{
+    for (size_t i = 0; i < 64; ++i) {
+        pixels[i] = (uint8_t)(i + sequence);
+    }
+
+    memset(image, 0, sizeof(*image));
+    image->header.frame_id.data = "camera_link";
+    image->header.frame_id.size = strlen("camera_link");
+    image->header.frame_id.capacity = strlen("camera_link") + 1;
+    image->header.stamp.sec = (int32_t)sequence;
+    image->height = 8;
+    image->width = 8;
+    image->encoding.data = "mono8";
+    image->encoding.size = strlen("mono8");
+    image->encoding.capacity = strlen("mono8") + 1;
+    image->step = 8;
+    image->data.data = pixels;
+    image->data.size = 64;
+    image->data.capacity = 64;
+}
+
+static int produce(msg_shm_ring* ring, uint32_t count)
+{
+    uint8_t pixels[64];
+    sensor_msgs__msg__Image image;
+
+    for (uint32_t sequence = 0; sequence < count; ++sequence) {
+        fill_image(&image, pixels, sequence);
+        // Spin while the consumer catches up (0: ring full); an error means retrying cannot help
+        ptrdiff_t written;
+        while ((written = write_sensor_msgs__msg__image_shm_ring(ring, &image)) == 0) {
+            sched_yield();
+        }
+        if (written == MSG_SHM_RING_TOO_LARGE) {
+            printf("Producer: image %u does not fit in a %d byte slot\n", sequence, RING_SLOT_SIZE);
+            return 1;
+        }
+    }
+    return 0;
+}
+
+static int consume(uint32_t count)
+{
+    msg_shm_ring ring;
+    if (!msg_shm_ring_open(&ring, RING_NAME)) {
+        printf("Consumer: failed to open ring %s\n", RING_NAME);
+        return 1;
+    }
+
+    int errors = 0;
+    for (uint32_t sequence = 0; sequence < count; ++sequence) {
+        sensor_msgs__msg__Image image;
+        ptrdiff_t read_bytes;
+        while ((read_bytes = read_sensor_msgs__msg__image_shm_ring(&ring, &image, 0)) == 0) {
+            sched_yield();
+        }
+        if (read_bytes == MSG_SHM_RING_MALFORMED) {
+            // The slot has been released; count it and move on to the next message
+            printf("Consumer: message %u is malformed\n", sequence);
+            errors++;
+            continue;
+        }
+
+        if (image.header.stamp.sec != (int32_t)sequence || image.data.size != 64 ||
+            image.data.data[63] != (uint8_t)(63 + sequence) || strcmp(image.encoding.data, "mono8") != 0) {
+            printf("Consumer: message %u does not match\n", sequence);
+            errors++;
+        }
+        free(image.header.frame_id.data);
+        free(image.encoding.data);
+        free(image.data.data);
+    }
+
+    msg_shm_ring_close(&ring);
+    printf("Consumer: received %u images, %d mismatches\n", count, errors);
+    return errors != 0;
+}
+
+int main(int argc, char** argv)
+{
+    msg_shm_ring ring;
+
+    // "--produce <count>" fills the ring and leaves it for another reader
+    // (e.g. python3 -m rosmsg_to_serializer.module.shm_ring_reader /rosmsg_to_serializer_example)
+    if (argc == 3 && strcmp(argv[1], "--produce") == 0) {
+        uint32_t count = (uint32_t)strtoul(argv[2], NULL, 10);
+        if (!msg_shm_ring_create(&ring, RING_NAME, RING_SLOTS, RING_SLOT_SIZE)) {
+            printf("Producer: failed to create ring %s\n", RING_NAME);
+            return 1;
+        }
+        int result = produce(&ring, count);
+        msg_shm_ring_close(&ring);
+        return result;
+    }
+
+    if (!msg_shm_ring_create(&ring, RING_NAME, RING_SLOTS, RING_SLOT_SIZE)) {
+        printf("Producer: failed to create ring %s\n", RING_NAME);
+        return 1;
+    }
+
+    pid_t consumer = fork();
+    if (consumer < 0) {
+        printf("fork failed\n");
+        return 1;
+    }
+    if (consumer == 0) {
+        int result = consume(MESSAGE_COUNT);
+        fflush(stdout);
+        _exit(result);
+    }
+
+    int produced = produce(&ring, MESSAGE_COUNT);
+    if (produced == 0) {
+        printf("Producer: sent %d images through %d slots\n", MESSAGE_COUNT, RING_SLOTS);
+    } else {
+        // The consumer would wait forever for the missing images
+        kill(consumer, SIGTERM);
+    }
+
+    int status = 0;
+    waitpid(consumer, &status, 0);
+    msg_shm_ring_close(&ring);
+    msg_shm_ring_unlink(RING_NAME);
+
+    if (produced != 0 || !WIFEXITED(status) || WEXITSTATUS(status) != 0) {
+        printf("shm_ring_example failed.\n");
+        return 1;
+    }
+    printf("shm_ring_example completed successfully.\n");
+    return 0;
+}